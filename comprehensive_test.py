@@ -5,20 +5,26 @@ import json
 import sys
 import os
 import tempfile
+import threading
 import shutil
-from unittest.mock import Mock, patch
+import subprocess
+from unittest.mock import MagicMock, Mock, patch
 from pathlib import Path
+import requests
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from infoblox_mcp.config import ConfigManager, InfoBloxConfig
-from infoblox_mcp.client import InfoBloxClient, InfoBloxAPIError
+from infoblox_mcp.config import ConfigManager, InfoBloxConfig, env_number
+from infoblox_mcp.client import InfoBloxClient, InfoBloxAPIError, REF_CACHE_MAX_SIZE
 from infoblox_mcp.tools import ToolRegistry
+from infoblox_mcp.splunk_client import SplunkClient, _iter_raw_lines
 from infoblox_mcp.error_handling import (
     setup_logging, validate_ip_address, validate_network_cidr,
-    validate_hostname, validate_mac_address, sanitize_input
+    validate_hostname, validate_mac_address, sanitize_input, ValidationError,
+    compile_schema_validator, ConfigurationError
 )
+from infoblox_mcp.json_utils import compile_envelope, to_json
 
 
 class TestResults:
@@ -84,6 +90,53 @@ async def test_configuration_management(results: TestResults):
             else:
                 results.fail_test("Configuration loading", "Failed to load or data mismatch")
             
+            # Grid Master accepts IP addresses and hostnames, not blanks
+            for address in ("192.168.1.100", "2001:db8::1", "cafe", "grid.example.com"):
+                try:
+                    InfoBloxConfig(grid_master_ip=f" {address} ", username="admin", password="password123")
+                    results.pass_test(f"Grid Master address accepted: {address}")
+                except Exception as e:
+                    results.fail_test(f"Grid Master address accepted: {address}", str(e))
+            try:
+                InfoBloxConfig(grid_master_ip="  ", username="admin", password="password123")
+                results.fail_test("Blank Grid Master address rejected", "No error raised")
+            except ValueError:
+                results.pass_test("Blank Grid Master address rejected")
+            
+            # Non-numeric integer settings name the offending variable
+            env = {
+                "INFOBLOX_GRID_MASTER_IP": "192.168.1.100",
+                "INFOBLOX_USERNAME": "admin",
+                "INFOBLOX_PASSWORD": "password123",
+                "INFOBLOX_TIMEOUT": "30s"
+            }
+            with patch.dict(os.environ, env):
+                try:
+                    config_manager.prompt_for_config()
+                    results.fail_test("Invalid INFOBLOX_TIMEOUT", "No error raised")
+                except ConfigurationError as e:
+                    if "INFOBLOX_TIMEOUT" in str(e):
+                        results.pass_test("Invalid INFOBLOX_TIMEOUT")
+                    else:
+                        results.fail_test("Invalid INFOBLOX_TIMEOUT", str(e))
+            
+            # Files written or removed by another manager are noticed
+            with tempfile.TemporaryDirectory() as shared_dir:
+                reader = ConfigManager(Path(shared_dir))
+                writer = ConfigManager(Path(shared_dir))
+                before = reader.load_config()
+                writer.save_config(test_config)
+                after = reader.load_config()
+                if before is None and after is not None and after.grid_master_ip == "192.168.1.100":
+                    results.pass_test("Configuration created elsewhere is seen")
+                else:
+                    results.fail_test("Configuration created elsewhere is seen", f"Loaded {after}")
+                writer.reset_config()
+                if reader.get_field("grid_master_ip") is None:
+                    results.pass_test("Configuration removed elsewhere is seen")
+                else:
+                    results.fail_test("Configuration removed elsewhere is seen", "Stale configuration")
+            
             # Test reset
             if config_manager.reset_config():
                 results.pass_test("Configuration reset")
@@ -161,6 +214,87 @@ async def test_validation_functions(results: TestResults):
             results.pass_test(f"Invalid MAC validation: {mac}")
         else:
             results.fail_test(f"Invalid MAC validation: {mac}", "Should be invalid")
+    
+    # Non-string input is invalid rather than an error
+    validators = (validate_ip_address, validate_network_cidr, validate_hostname, validate_mac_address)
+    for validator in validators:
+        for value in (["192.168.1.1"], {"ip": "192.168.1.1"}, None, 3232235777):
+            try:
+                if not validator(value):
+                    results.pass_test(f"Non-string validation: {validator.__name__}({value!r})")
+                else:
+                    results.fail_test(f"Non-string validation: {validator.__name__}({value!r})", "Should be invalid")
+            except Exception as e:
+                results.fail_test(f"Non-string validation: {validator.__name__}({value!r})", str(e))
+
+
+async def test_env_settings(results: TestResults):
+    """Test parsing of the numeric tuning settings read at import time."""
+    print("Testing Environment Settings...")
+    
+    cases = [
+        ("unset", None, 16),
+        ("valid", "8", 8),
+        ("not a number", "sixteen", 16),
+        ("zero", "0", 1),
+        ("negative", "-4", 1)
+    ]
+    for case, raw, expected in cases:
+        env = {} if raw is None else {"INFOBLOX_MAX_CONCURRENCY": raw}
+        with patch.dict(os.environ, env):
+            if raw is None:
+                os.environ.pop("INFOBLOX_MAX_CONCURRENCY", None)
+            try:
+                value = env_number("INFOBLOX_MAX_CONCURRENCY", 16, minimum=1)
+                if value == expected:
+                    results.pass_test(f"Integer setting: {case}")
+                else:
+                    results.fail_test(f"Integer setting: {case}", f"Got {value}, expected {expected}")
+            except Exception as e:
+                results.fail_test(f"Integer setting: {case}", str(e))
+    
+    # Float settings clamp the same way; a negative cache TTL disables it
+    for raw, expected in (("2.5", 2.5), ("-1", 0), ("soon", 30.0)):
+        with patch.dict(os.environ, {"INFOBLOX_TOOL_CACHE_TTL": raw}):
+            value = env_number("INFOBLOX_TOOL_CACHE_TTL", 30.0, minimum=0, cast=float)
+            if value == expected:
+                results.pass_test(f"Cache TTL setting: {raw}")
+            else:
+                results.fail_test(f"Cache TTL setting: {raw}", f"Got {value}, expected {expected}")
+    
+    # The connection pool is never smaller than the concurrency limit
+    for raw, expected in (("4", 16), ("64", 64), ("many", 32)):
+        with patch.dict(os.environ, {"INFOBLOX_HTTP_POOL_SIZE": raw}):
+            value = env_number("INFOBLOX_HTTP_POOL_SIZE", 32, minimum=16)
+            if value == expected:
+                results.pass_test(f"Pool size setting: {raw}")
+            else:
+                results.fail_test(f"Pool size setting: {raw}", f"Got {value}, expected {expected}")
+    
+    # A zero concurrency limit still leaves one worker for async calls
+    script = (
+        "import asyncio, sys\n"
+        "from unittest.mock import patch\n"
+        "sys.path.insert(0, 'src')\n"
+        "from infoblox_mcp.client import InfoBloxClient\n"
+        "from infoblox_mcp.config import InfoBloxConfig\n"
+        "config = InfoBloxConfig(grid_master_ip='192.168.1.100', username='admin', password='password123')\n"
+        "with patch.object(InfoBloxClient, '_authenticate'):\n"
+        "    client = InfoBloxClient(config)\n"
+        "print(asyncio.run(asyncio.wait_for(client._run_async(lambda: 'ok'), 10)))\n"
+    )
+    env = dict(os.environ, INFOBLOX_MAX_CONCURRENCY="0")
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+            env=env, capture_output=True, text=True, timeout=60
+        )
+        if completed.stdout.strip() == "ok":
+            results.pass_test("Async call with zero concurrency setting")
+        else:
+            results.fail_test("Async call with zero concurrency setting", completed.stderr.strip()[-200:])
+    except subprocess.TimeoutExpired:
+        results.fail_test("Async call with zero concurrency setting", "Timed out")
 
 
 async def test_tool_registry(results: TestResults):
@@ -299,6 +433,619 @@ async def test_mock_client_operations(results: TestResults):
         results.fail_test("Mock client operations", str(e))
 
 
+class FakeZoneClient:
+    """In-memory stand-in for the async client methods used by the zone tools."""
+    
+    def __init__(self):
+        self.zones = [{"fqdn": "a.example.com"}]
+        self.searches = 0
+        # When set, searches wait on it after reading the zones
+        self.hold = None
+    
+    async def search_objects_async(self, object_type, search_params=None):
+        self.searches += 1
+        snapshot = list(self.zones)
+        if self.hold is not None:
+            await self.hold.wait()
+        return snapshot
+    
+    async def create_object_async(self, object_type, object_data):
+        self.zones.append({"fqdn": object_data["fqdn"]})
+        return f"zone_auth/NEW:{object_data['fqdn']}"
+
+
+async def test_response_cache(results: TestResults):
+    """Test the read-only tool response cache."""
+    print("Testing Response Cache...")
+    
+    try:
+        registry = ToolRegistry()
+        client = FakeZoneClient()
+        
+        await registry.execute_tool("infoblox_dns_list_zones", {}, client)
+        await registry.execute_tool("infoblox_dns_list_zones", {}, client)
+        if client.searches == 1:
+            results.pass_test("Response cache hit")
+        else:
+            results.fail_test("Response cache hit", f"{client.searches} searches for 2 calls")
+        
+        await registry.execute_tool("infoblox_dns_create_zone", {"fqdn": "b.example.com"}, client)
+        listing = json.loads(await registry.execute_tool("infoblox_dns_list_zones", {}, client))
+        if client.searches == 2 and listing["count"] == 2:
+            results.pass_test("Response cache invalidated by write")
+        else:
+            results.fail_test("Response cache invalidated by write", f"Got {listing}")
+        
+        # A read that started before a write must not cache its old result
+        client.hold = asyncio.Event()
+        read = asyncio.ensure_future(registry.execute_tool("infoblox_dns_list_zones", {"view": "v"}, client))
+        await asyncio.sleep(0)
+        await registry.execute_tool("infoblox_dns_create_zone", {"fqdn": "c.example.com"}, client)
+        client.hold.set()
+        stale = json.loads(await read)
+        client.hold = None
+        listing = json.loads(await registry.execute_tool("infoblox_dns_list_zones", {"view": "v"}, client))
+        if stale["count"] == 2 and listing["count"] == 3:
+            results.pass_test("Response cache skips reads overlapping a write")
+        else:
+            results.fail_test("Response cache skips reads overlapping a write", f"Got {listing}")
+        
+        # Responses from one client are not served for another (the server
+        # rebuilds its client after a config change)
+        other = FakeZoneClient()
+        other.zones = [{"fqdn": "other.example.com"}]
+        await registry.execute_tool("infoblox_dns_list_zones", {}, client)
+        listing = json.loads(await registry.execute_tool("infoblox_dns_list_zones", {}, other))
+        if other.searches == 1 and listing["zones"] == other.zones:
+            results.pass_test("Response cache is per client")
+        else:
+            results.fail_test("Response cache is per client", f"Got {listing}")
+        
+        # Grid status is a health check and always goes to the grid
+        client.zones = [{"_ref": "grid/x"}]
+        first = json.loads(await registry.execute_tool("infoblox_grid_get_status", {}, client))
+        client.zones = []
+        second = json.loads(await registry.execute_tool("infoblox_grid_get_status", {}, client))
+        if first["status"] == "operational" and second["status"] == "unknown":
+            results.pass_test("Grid status not cached")
+        else:
+            results.fail_test("Grid status not cached", f"Got {second}")
+        
+    except Exception as e:
+        results.fail_test("Response cache", str(e))
+
+
+class FakeMultiClient:
+    """Records WAPI multi-object requests instead of sending them."""
+    
+    def __init__(self):
+        self.requests = []
+    
+    async def multi_request_async(self, operations):
+        self.requests.append(operations)
+        return [f"{op['object']}/NEW:{i}" for i, op in enumerate(operations)]
+
+
+async def test_bulk_create_records(results: TestResults):
+    """Test bulk DNS record creation."""
+    print("Testing Bulk Record Creation...")
+    
+    try:
+        registry = ToolRegistry()
+        client = FakeMultiClient()
+        
+        records = [
+            {"type": "a", "data": {"name": "h1.example.com", "ipv4addr": "10.0.0.1"}},
+            {"type": "host", "data": {"name": "h2.example.com", "ipv4addrs": [{"ipv4addr": "10.0.0.2"}]}},
+            {"type": "cname", "data": {"name": "w.example.com", "canonical": "h1.example.com"}}
+        ]
+        response = json.loads(await registry.execute_tool("infoblox_dns_bulk_create_records", {"records": records}, client))
+        objects = [op["object"] for op in client.requests[0]]
+        if response["count"] == 3 and objects == ["record:a", "record:host", "record:cname"]:
+            results.pass_test("Bulk create A/host/CNAME records")
+        else:
+            results.fail_test("Bulk create A/host/CNAME records", f"Got {response}")
+        
+        bad_batches = {
+            "non-object item": ["h.example.com"],
+            "unsupported type": [{"type": "ns", "data": {"name": "x"}}],
+            "missing field": [{"type": "a", "data": {"name": "h.example.com"}}],
+            "invalid ipv4addr": [{"type": "a", "data": {"name": "h.example.com", "ipv4addr": "10.0.0.300"}}],
+            "invalid host addresses": [{"type": "host", "data": {"name": "h.example.com", "ipv4addrs": ["10.0.0.1"]}}]
+        }
+        for label, batch in bad_batches.items():
+            sent = len(client.requests)
+            try:
+                await registry.execute_tool("infoblox_dns_bulk_create_records", {"records": records[:1] + batch}, client)
+                results.fail_test(f"Bulk create rejects {label}", "No error raised")
+            except ValidationError:
+                if len(client.requests) == sent:
+                    results.pass_test(f"Bulk create rejects {label}")
+                else:
+                    results.fail_test(f"Bulk create rejects {label}", "Request was sent")
+        
+    except Exception as e:
+        results.fail_test("Bulk record creation", str(e))
+
+
+class FailingClient:
+    """Client whose searches fail with a WAPI error."""
+    
+    async def search_objects_async(self, object_type, search_params=None):
+        raise InfoBloxAPIError("Not found", status_code=404)
+    
+    async def search_objects_paged_async(self, object_type, search_params=None, page_size=None, page_id=None):
+        raise InfoBloxAPIError("Not found", status_code=404)
+
+
+async def test_tool_errors(results: TestResults):
+    """Test that WAPI errors reach the caller unchanged from every tool module."""
+    print("Testing Tool Errors...")
+    
+    registry = ToolRegistry()
+    for tool_name in ("infoblox_dns_list_zones", "infoblox_dns_list_views", "infoblox_dhcp_list_ranges"):
+        try:
+            await registry.execute_tool(tool_name, {}, FailingClient())
+            results.fail_test(f"WAPI error status kept: {tool_name}", "No error raised")
+        except InfoBloxAPIError as e:
+            if e.status_code == 404:
+                results.pass_test(f"WAPI error status kept: {tool_name}")
+            else:
+                results.fail_test(f"WAPI error status kept: {tool_name}", f"status_code={e.status_code}")
+        except Exception as e:
+            results.fail_test(f"WAPI error status kept: {tool_name}", str(e))
+    
+    # Bad input found by the tools themselves is a ValidationError, as from
+    # the schema check, not an API error
+    invalid_calls = [
+        ("infoblox_dns_create_record_aaaa", {"name": "host.example.com", "ipv6addr": "not-an-address"}),
+        ("infoblox_dns_create_rpz_zone", {"fqdn": "x:y"}),
+        ("infoblox_dns_delete_zone", {"zone_ref": "not a zone!"})
+    ]
+    for tool_name, arguments in invalid_calls:
+        try:
+            await registry.execute_tool(tool_name, arguments, FailingClient())
+            results.fail_test(f"Input error is ValidationError: {tool_name}", "No error raised")
+        except ValidationError:
+            results.pass_test(f"Input error is ValidationError: {tool_name}")
+        except Exception as e:
+            results.fail_test(f"Input error is ValidationError: {tool_name}", f"{type(e).__name__}: {e}")
+
+
+def make_mock_client() -> InfoBloxClient:
+    """Create an InfoBloxClient whose HTTP session is a mock."""
+    config = InfoBloxConfig(
+        grid_master_ip="192.168.1.100",
+        username="admin",
+        password="password123"
+    )
+    with patch('requests.Session') as mock_session:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = []
+        mock_response.cookies = {'ibapauth': 'test_cookie'}
+        for method in ("get", "post", "put", "delete", "request"):
+            getattr(mock_session.return_value, method).return_value = mock_response
+        return InfoBloxClient(config)
+
+
+async def test_ref_cache(results: TestResults):
+    """Test the client's resolved reference cache."""
+    print("Testing Reference Cache...")
+    
+    try:
+        client = make_mock_client()
+        zone_ref = "zone_auth/ZG5z:a.example.com/default"
+        searches = []
+        
+        def search_objects(object_type, search_params=None):
+            searches.append(search_params)
+            return [{"_ref": zone_ref}]
+        
+        client.search_objects = search_objects
+        client.delete = lambda endpoint, params=None: endpoint
+        
+        await client.resolve_ref_async("zone_auth", "fqdn", "a.example.com")
+        await client.resolve_ref_async("zone_auth", "fqdn", "a.example.com")
+        if len(searches) == 1:
+            results.pass_test("Reference cache hit")
+        else:
+            results.fail_test("Reference cache hit", f"{len(searches)} searches for 2 lookups")
+        
+        # Sync deletes (as used by the bulk tools) invalidate too
+        client.delete_object(zone_ref)
+        await client.resolve_ref_async("zone_auth", "fqdn", "a.example.com")
+        if len(searches) == 2:
+            results.pass_test("Reference cache invalidated by delete")
+        else:
+            results.fail_test("Reference cache invalidated by delete", "Stale reference served")
+        
+        # A lookup that overlaps a delete must not cache what it found
+        def search_during_delete(object_type, search_params=None):
+            searches.append(search_params)
+            client.delete_object(zone_ref)
+            return [{"_ref": zone_ref}]
+        
+        client.search_objects = search_during_delete
+        await client.resolve_ref_async("zone_auth", "fqdn", "b.example.com")
+        client.search_objects = search_objects
+        await client.resolve_ref_async("zone_auth", "fqdn", "b.example.com")
+        if len(searches) == 4:
+            results.pass_test("Reference cache skips lookups overlapping a delete")
+        else:
+            results.fail_test("Reference cache skips lookups overlapping a delete", "Stale reference cached")
+        
+        # A cache hit keeps the entry from being the next one evicted
+        with patch("infoblox_mcp.client.REF_CACHE_MAX_SIZE", 2):
+            client._ref_cache.clear()
+            generation = client._ref_generation
+            client._cache_ref(("zone_auth", "fqdn", "x"), "zone_auth/x", 300, generation)
+            client._cache_ref(("zone_auth", "fqdn", "y"), "zone_auth/y", 300, generation)
+            await client.resolve_ref_async("zone_auth", "fqdn", "x")
+            client._cache_ref(("zone_auth", "fqdn", "z"), "zone_auth/z", 300, generation)
+            if list(client._ref_cache) == [("zone_auth", "fqdn", "x"), ("zone_auth", "fqdn", "z")]:
+                results.pass_test("Reference cache evicts least recently used")
+            else:
+                results.fail_test("Reference cache evicts least recently used", f"Kept {list(client._ref_cache)}")
+        
+        # Invalidations from worker threads can overlap cache reads, which
+        # drop expired entries
+        client._ref_cache.clear()
+        for n in range(REF_CACHE_MAX_SIZE):
+            client._ref_cache[("zone_auth", "fqdn", f"{n}.example.com")] = (f"zone_auth/{n}", 0.0)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        stop = threading.Event()
+        errors = []
+        
+        def invalidate_repeatedly():
+            while not stop.is_set():
+                try:
+                    client._invalidate_ref("zone_auth/unrelated")
+                except RuntimeError as e:
+                    errors.append(e)
+                    return
+        
+        worker = threading.Thread(target=invalidate_repeatedly)
+        worker.start()
+        try:
+            for n in range(REF_CACHE_MAX_SIZE):
+                await client.resolve_ref_async("zone_auth", "fqdn", f"{n}.example.com")
+                if errors:
+                    break
+        except RuntimeError as e:
+            errors.append(e)
+        finally:
+            stop.set()
+            worker.join()
+            sys.setswitchinterval(switch_interval)
+        if errors:
+            results.fail_test("Reference cache reads overlap invalidation", str(errors[0]))
+        else:
+            results.pass_test("Reference cache reads overlap invalidation")
+        
+        # Cancelling the caller running a shared lookup must not cancel
+        # the callers waiting on it
+        release = asyncio.Event()
+        
+        async def slow_search(object_type, search_params=None):
+            if not release.is_set():
+                await release.wait()
+            return [{"_ref": zone_ref}]
+        
+        client.search_objects_async = slow_search
+        leader = asyncio.ensure_future(client.resolve_ref_async("zone_auth", "fqdn", "c.example.com"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(client.resolve_ref_async("zone_auth", "fqdn", "c.example.com"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        try:
+            if await follower == zone_ref:
+                results.pass_test("Shared lookup survives leader cancellation")
+            else:
+                results.fail_test("Shared lookup survives leader cancellation", "Wrong reference")
+        except asyncio.CancelledError:
+            results.fail_test("Shared lookup survives leader cancellation", "Follower was cancelled")
+        
+    except Exception as e:
+        results.fail_test("Reference cache", str(e))
+
+
+async def test_schema_validator(results: TestResults):
+    """Test compiled tool input schema validation."""
+    print("Testing Schema Validator...")
+    
+    validate = compile_schema_validator({
+        "type": "object",
+        "properties": {
+            "fqdn": {"type": "string"},
+            "page_size": {"type": "integer", "minimum": 1, "maximum": 1000},
+            "view": {"type": "string", "enum": ["default", "internal"]},
+            "disable": {"type": "boolean"}
+        },
+        "required": ["fqdn"]
+    })
+    
+    accepted = [
+        {"fqdn": "example.com"},
+        {"fqdn": "example.com", "page_size": 1, "view": "internal", "disable": False}
+    ]
+    rejected = [
+        ("missing required", {"page_size": 10}),
+        ("wrong type", {"fqdn": 42}),
+        ("bool as integer", {"fqdn": "example.com", "page_size": True}),
+        ("below minimum", {"fqdn": "example.com", "page_size": 0}),
+        ("above maximum", {"fqdn": "example.com", "page_size": 1001}),
+        ("not in enum", {"fqdn": "example.com", "view": "external"})
+    ]
+    
+    for arguments in accepted:
+        try:
+            validate(arguments)
+            results.pass_test(f"Schema accepts: {arguments}")
+        except ValidationError as e:
+            results.fail_test(f"Schema accepts: {arguments}", str(e))
+    
+    for case, arguments in rejected:
+        try:
+            validate(arguments)
+            results.fail_test(f"Schema rejects: {case}", "No error raised")
+        except ValidationError:
+            results.pass_test(f"Schema rejects: {case}")
+
+
+async def test_response_envelope(results: TestResults):
+    """Test that precompiled envelopes serialize exactly like to_json."""
+    print("Testing Response Envelope...")
+    
+    values = [
+        ("zone_auth/ZG5z:example.com/default", 3),
+        ({"nested": [1, 2.5, None]}, "caf\u00e9 \"quoted\""),
+        ([], {})
+    ]
+    for constants in ({"success": True}, {}):
+        envelope = compile_envelope(constants, ("ref", "count"))
+        for ref, count in values:
+            expected = to_json({**constants, "ref": ref, "count": count})
+            actual = envelope(ref, count)
+            if actual == expected:
+                results.pass_test(f"Envelope matches to_json: {constants} {ref!r}")
+            else:
+                results.fail_test(f"Envelope matches to_json: {constants} {ref!r}", f"{actual} != {expected}")
+
+
+async def test_paging(results: TestResults):
+    """Test that paged searches follow next_page_id to the last page."""
+    print("Testing Paging...")
+    
+    try:
+        client = make_mock_client()
+        pages = {
+            None: {"result": [{"fqdn": "a.example.com"}, {"fqdn": "b.example.com"}], "next_page_id": "p2"},
+            "p2": {"result": [{"fqdn": "c.example.com"}, {"fqdn": "d.example.com"}], "next_page_id": "p3"},
+            "p3": {"result": [{"fqdn": "e.example.com"}]}
+        }
+        requests_made = []
+        
+        def get(endpoint, params=None):
+            requests_made.append(params)
+            return pages[params.get("_page_id")]
+        
+        client.get = get
+        
+        fqdns = []
+        page_id = None
+        while True:
+            page = client.search_objects_paged("zone_auth", {"view": "default"}, page_size=2, page_id=page_id)
+            fqdns.extend(zone["fqdn"] for zone in page["result"])
+            page_id = page["next_page_id"]
+            if page_id is None:
+                break
+        
+        if fqdns == ["a.example.com", "b.example.com", "c.example.com", "d.example.com", "e.example.com"]:
+            results.pass_test("Paging follows next_page_id")
+        else:
+            results.fail_test("Paging follows next_page_id", f"Got {fqdns}")
+        
+        first = requests_made[0]
+        if first == {"view": "default", "_paging": 1, "_max_results": 2, "_return_as_object": 1}:
+            results.pass_test("Paging first request")
+        else:
+            results.fail_test("Paging first request", f"Params {first}")
+        
+        if requests_made[1:] == [{"_page_id": "p2"}, {"_page_id": "p3"}]:
+            results.pass_test("Paging follow-up requests")
+        else:
+            results.fail_test("Paging follow-up requests", f"Params {requests_made[1:]}")
+        
+        # The list tools hand next_page_id back to the caller
+        registry = ToolRegistry()
+        response = json.loads(await registry.execute_tool(
+            "infoblox_dhcp_list_ranges", {"page_size": 2, "page_id": "p2"}, client))
+        if response.get("next_page_id") == "p3" and response.get("count") == 2:
+            results.pass_test("List tool returns next_page_id")
+        else:
+            results.fail_test("List tool returns next_page_id", f"Got {response}")
+        
+    except Exception as e:
+        results.fail_test("Paging", str(e))
+
+
+async def test_splunk_client(results: TestResults):
+    """Test Splunk export stream parsing and response handling."""
+    print("Testing Splunk Client...")
+    
+    stream = b'{"result": {"a": 1}}\n\n{"result": {"b": 2}}\n  \n{"result": {"c": 3}}'
+    expected = [b'{"result": {"a": 1}}', b'{"result": {"b": 2}}', b'{"result": {"c": 3}}']
+    for size in (1, 3, 7, len(stream)):
+        response = Mock()
+        response.iter_content.return_value = [stream[i:i + size] for i in range(0, len(stream), size)]
+        lines = list(_iter_raw_lines(response))
+        if lines == expected:
+            results.pass_test(f"Splunk stream lines: {size}-byte chunks")
+        else:
+            results.fail_test(f"Splunk stream lines: {size}-byte chunks", f"Got {lines}")
+    
+    config = InfoBloxConfig(
+        grid_master_ip="192.168.1.100",
+        username="admin",
+        password="password123",
+        splunk_url="https://splunk.example.com:8089",
+        splunk_token="token"
+    )
+    client = SplunkClient(config)
+    
+    response = MagicMock()
+    response.ok = True
+    response.iter_content.return_value = [stream]
+    response.__enter__.return_value = response
+    client.session.post = Mock(return_value=response)
+    rows = client.search("index=main", count=2)
+    if rows == [{"a": 1}, {"b": 2}]:
+        results.pass_test("Splunk search results")
+    else:
+        results.fail_test("Splunk search results", f"Got {rows}")
+    
+    # Error responses are streamed too and must still be closed
+    response = MagicMock()
+    response.ok = False
+    response.text = "Unauthorized"
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Client Error")
+    response.__enter__.return_value = response
+    client.session.post = Mock(return_value=response)
+    try:
+        client.search("index=main")
+        results.fail_test("Splunk error response closed", "No error raised")
+    except Exception:
+        if response.__exit__.called:
+            results.pass_test("Splunk error response closed")
+        else:
+            results.fail_test("Splunk error response closed", "Response left open")
+    client.close()
+
+
+async def test_delete_zones(results: TestResults):
+    """Test bulk zone deletion with per-zone outcomes."""
+    print("Testing Bulk Zone Deletion...")
+    
+    try:
+        client = make_mock_client()
+        zones = {"a.example.com": "zone_auth/a", "b.example.com": "zone_auth/b"}
+        deleted = []
+        
+        def multi_request(operations):
+            return [[{"_ref": zones[op["data"]["fqdn"]]}] if op["data"]["fqdn"] in zones else [] for op in operations]
+        
+        def delete(endpoint, params=None):
+            if endpoint == "zone_auth/b":
+                raise InfoBloxAPIError("Zone has records", status_code=400)
+            deleted.append(endpoint)
+            return endpoint
+        
+        client.multi_request = multi_request
+        client.delete = delete
+        
+        registry = ToolRegistry()
+        zone_refs = ["a.example.com", "b.example.com", "missing.example.com", "zone_auth/c", "not a zone!"]
+        response = json.loads(await registry.execute_tool(
+            "infoblox_dns_delete_zones", {"zone_refs": zone_refs}, client))
+        
+        outcomes = [(entry["zone"], entry["success"]) for entry in response["results"]]
+        expected = [
+            ("a.example.com", True), ("b.example.com", False), ("missing.example.com", False),
+            ("zone_auth/c", True), ("not a zone!", False)
+        ]
+        if outcomes == expected and sorted(deleted) == ["zone_auth/a", "zone_auth/c"]:
+            results.pass_test("Bulk zone deletion per-zone outcomes")
+        else:
+            results.fail_test("Bulk zone deletion per-zone outcomes", f"Got {outcomes}, deleted {deleted}")
+        
+        if (response["success"], response["deleted"], response["failed"]) == (False, 2, 3):
+            results.pass_test("Bulk zone deletion totals")
+        else:
+            results.fail_test("Bulk zone deletion totals", f"Got {response}")
+        
+        errors = {entry["zone"]: entry.get("error", "") for entry in response["results"]}
+        if ("Zone has records" in errors["b.example.com"]
+                and "not found" in errors["missing.example.com"]
+                and "Invalid zone identifier" in errors["not a zone!"]):
+            results.pass_test("Bulk zone deletion errors")
+        else:
+            results.fail_test("Bulk zone deletion errors", f"Got {errors}")
+        
+    except Exception as e:
+        results.fail_test("Bulk zone deletion", str(e))
+
+
+async def test_batched_ref_lookup(results: TestResults):
+    """Test resolving several references in one multi-object request."""
+    print("Testing Batched Reference Lookup...")
+    
+    try:
+        client = make_mock_client()
+        zones = {"a.example.com": "zone_auth/a", "b.example.com": "zone_auth/b", "c.example.com": "zone_auth/c"}
+        batches = []
+        
+        def multi_request(operations):
+            batches.append([op["data"]["fqdn"] for op in operations])
+            return [[{"_ref": zones[op["data"]["fqdn"]]}] if op["data"]["fqdn"] in zones else [] for op in operations]
+        
+        client.multi_request = multi_request
+        
+        refs = await client.resolve_refs_async(
+            "zone_auth", "fqdn", ["c.example.com", "missing.example.com", "a.example.com", "c.example.com"])
+        expected = {"c.example.com": "zone_auth/c", "missing.example.com": None, "a.example.com": "zone_auth/a"}
+        if refs == expected and batches == [["c.example.com", "missing.example.com", "a.example.com"]]:
+            results.pass_test("Batched lookup maps results to inputs")
+        else:
+            results.fail_test("Batched lookup maps results to inputs", f"Got {refs}, batches {batches}")
+        
+        # Found references are cached; misses are looked up again
+        refs = await client.resolve_refs_async("zone_auth", "fqdn", ["a.example.com", "b.example.com", "missing.example.com"])
+        if (refs == {"a.example.com": "zone_auth/a", "b.example.com": "zone_auth/b", "missing.example.com": None}
+                and batches[1:] == [["b.example.com", "missing.example.com"]]):
+            results.pass_test("Batched lookup only requests cache misses")
+        else:
+            results.fail_test("Batched lookup only requests cache misses", f"Got {refs}, batches {batches}")
+        
+        # When the batch call fails, bulk zone deletion resolves one by one
+        client = make_mock_client()
+        searches = []
+        deleted = []
+        
+        def failing_multi_request(operations):
+            raise InfoBloxAPIError("request object not supported", status_code=400)
+        
+        def search_objects(object_type, search_params=None):
+            searches.append(search_params["fqdn"])
+            ref = zones.get(search_params["fqdn"])
+            return [{"_ref": ref}] if ref else []
+        
+        def delete(endpoint, params=None):
+            deleted.append(endpoint)
+            return endpoint
+        
+        client.multi_request = failing_multi_request
+        client.search_objects = search_objects
+        client.delete = delete
+        
+        registry = ToolRegistry()
+        response = json.loads(await registry.execute_tool(
+            "infoblox_dns_delete_zones", {"zone_refs": ["a.example.com", "b.example.com", "missing.example.com"]}, client))
+        outcomes = [(entry["zone"], entry["success"]) for entry in response["results"]]
+        if (outcomes == [("a.example.com", True), ("b.example.com", True), ("missing.example.com", False)]
+                and sorted(searches) == ["a.example.com", "b.example.com", "missing.example.com"]
+                and sorted(deleted) == ["zone_auth/a", "zone_auth/b"]):
+            results.pass_test("Batched lookup falls back to single lookups")
+        else:
+            results.fail_test("Batched lookup falls back to single lookups", f"Got {outcomes}, searches {searches}")
+        
+    except Exception as e:
+        results.fail_test("Batched reference lookup", str(e))
+
+
 async def test_server_initialization(results: TestResults):
     """Test MCP server initialization."""
     print("Testing Server Initialization...")
@@ -332,10 +1079,21 @@ async def main():
     
     # Run all test suites
     await test_configuration_management(results)
+    await test_env_settings(results)
     await test_validation_functions(results)
+    await test_schema_validator(results)
+    await test_response_envelope(results)
     await test_tool_registry(results)
     await test_error_handling(results)
     await test_mock_client_operations(results)
+    await test_response_cache(results)
+    await test_bulk_create_records(results)
+    await test_ref_cache(results)
+    await test_delete_zones(results)
+    await test_batched_ref_lookup(results)
+    await test_tool_errors(results)
+    await test_paging(results)
+    await test_splunk_client(results)
     await test_server_initialization(results)
     
     print("\n" + "=" * 50)
@@ -64,8 +64,9 @@ class MCPChat:
             print(f"Connection failed: {e}")
         finally:
             if self.client:
-                # No close method on client currently, effectively handled by GC
-                pass
+                self.client.close()
+            if self.llm_client:
+                self.llm_client.close()
 
     async def _chat_loop(self):
         while True:
@@ -301,7 +302,7 @@ class MCPChat:
         try:
              # Get tools from registry
              tools = self.registry.get_all_tools()
-             response = self.llm_client.generate_response(text, tools)
+             response = await self.llm_client.generate_response_async(text, tools)
              
              if response["type"] == "text":
                  print("\nAI Response:")
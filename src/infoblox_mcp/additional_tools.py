@@ -1,9 +1,10 @@
 """Extended tool implementations for InfoBlox MCP Server - Additional Tools."""
 
-import json
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 from .client import InfoBloxClient, InfoBloxAPIError
+from .json_utils import to_json
 import csv
 import ast
 
@@ -152,10 +153,10 @@ class IPAMTools:
                 "message": "Network discovery started"
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error starting network discovery: {str(e)}")
+            logger.error("Error starting network discovery: %s", e)
             raise InfoBloxAPIError(f"Failed to start network discovery: {str(e)}")
     
     @staticmethod
@@ -176,10 +177,10 @@ class IPAMTools:
                 "scan_result": scan_result
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error scanning network: {str(e)}")
+            logger.error("Error scanning network: %s", e)
             raise InfoBloxAPIError(f"Failed to scan network: {str(e)}")
     
     @staticmethod
@@ -199,15 +200,15 @@ class IPAMTools:
             
             result = client.post(f"networkcontainer/{container}", params=params)
             
-            return json.dumps({
+            return to_json({
                 "container": container,
                 "cidr": cidr,
                 "available_networks": result,
                 "count": len(result) if isinstance(result, list) else 1
-            }, indent=2)
+            })
             
         except Exception as e:
-            logger.error(f"Error finding next available network: {str(e)}")
+            logger.error("Error finding next available network: %s", e)
             raise InfoBloxAPIError(f"Failed to find next available network: {str(e)}")
     
     @staticmethod
@@ -229,10 +230,10 @@ class IPAMTools:
                 "subnets": [str(subnet) for subnet in subnets[:100]]  # Limit to first 100
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error calculating subnets: {str(e)}")
+            logger.error("Error calculating subnets: %s", e)
             raise InfoBloxAPIError(f"Failed to calculate subnets: {str(e)}")
     
     @staticmethod
@@ -247,32 +248,30 @@ class IPAMTools:
             if "_max_results" not in params:
                  params["_max_results"] = 500
             
-            networks = client.search_objects("network", params)
+            networks = await client.search_objects_async("network", params)
             
             utilization_data = []
             threshold = args.get("threshold", 80)
             
-            for network in networks:
-                try:
-                    network_ref = network["_ref"]
-                    utilization = client.get_network_utilization(network_ref)
-                    
-                    if isinstance(utilization, dict):
-                        util_percent = utilization.get("utilization", 0)
-                        if util_percent >= threshold:
-                            utilization_data.append({
-                                "network": network.get("network", "Unknown"),
-                                "utilization": utilization,
-                                "above_threshold": True
-                            })
-                        else:
-                            utilization_data.append({
-                                "network": network.get("network", "Unknown"),
-                                "utilization": utilization,
-                                "above_threshold": False
-                            })
-                except Exception as e:
-                    logger.warning(f"Could not get utilization for network {network.get('network', 'Unknown')}: {str(e)}")
+            # Fetch every network's utilization concurrently; the client's
+            # semaphore bounds how many WAPI calls are in flight
+            outcomes = await asyncio.gather(
+                *(client.get_network_utilization_async(network["_ref"]) for network in networks),
+                return_exceptions=True
+            )
+            
+            for network, utilization in zip(networks, outcomes):
+                if isinstance(utilization, BaseException):
+                    logger.warning("Could not get utilization for network %s: %s", network.get("network", "Unknown"), utilization)
+                    continue
+                
+                if isinstance(utilization, dict):
+                    util_percent = utilization.get("utilization", 0)
+                    utilization_data.append({
+                        "network": network.get("network", "Unknown"),
+                        "utilization": utilization,
+                        "above_threshold": util_percent >= threshold
+                    })
             
             result = {
                 "threshold": threshold,
@@ -282,10 +281,10 @@ class IPAMTools:
                 "utilization_data": utilization_data
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error getting utilization summary: {str(e)}")
+            logger.error("Error getting utilization summary: %s", e)
             raise InfoBloxAPIError(f"Failed to get utilization summary: {str(e)}")
 
 
@@ -409,10 +408,10 @@ class GridTools:
             member_ref = members[0]["_ref"]
             member_details = client.get_object_by_ref(member_ref)
             
-            return json.dumps(member_details, indent=2)
+            return to_json(member_details)
             
         except Exception as e:
-            logger.error(f"Error getting member details: {str(e)}")
+            logger.error("Error getting member details: %s", e)
             raise InfoBloxAPIError(f"Failed to get member details: {str(e)}")
     
     @staticmethod
@@ -436,15 +435,15 @@ class GridTools:
             
             result = client.post(f"{member_ref}?_function=restartservices", data=restart_data)
             
-            return json.dumps({
+            return to_json({
                 "success": True,
                 "member": member_name,
                 "service_option": service_option,
                 "result": result
-            }, indent=2)
+            })
             
         except Exception as e:
-            logger.error(f"Error restarting services: {str(e)}")
+            logger.error("Error restarting services: %s", e)
             raise InfoBloxAPIError(f"Failed to restart services: {str(e)}")
     
     @staticmethod
@@ -467,10 +466,10 @@ class GridTools:
                 "backup_type": backup_data["backup_type"]
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error creating backup: {str(e)}")
+            logger.error("Error creating backup: %s", e)
             raise InfoBloxAPIError(f"Failed to create backup: {str(e)}")
     
     @staticmethod
@@ -484,10 +483,10 @@ class GridTools:
                 "count": len(backups)
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error listing backups: {str(e)}")
+            logger.error("Error listing backups: %s", e)
             raise InfoBloxAPIError(f"Failed to list backups: {str(e)}")
     
     @staticmethod
@@ -506,10 +505,10 @@ class GridTools:
                 "member_count": len(members)
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error getting system info: {str(e)}")
+            logger.error("Error getting system info: %s", e)
             raise InfoBloxAPIError(f"Failed to get system info: {str(e)}")
     
     @staticmethod
@@ -527,10 +526,10 @@ class GridTools:
                 "count": len(capacity_reports)
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error getting capacity report: {str(e)}")
+            logger.error("Error getting capacity report: %s", e)
             raise InfoBloxAPIError(f"Failed to get capacity report: {str(e)}")
 
 
@@ -666,10 +665,10 @@ class BulkTools:
                 "object_type": args["object_type"]
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error importing CSV: {str(e)}")
+            logger.error("Error importing CSV: %s", e)
             raise InfoBloxAPIError(f"Failed to import CSV: {str(e)}")
     
     @staticmethod
@@ -694,10 +693,10 @@ class BulkTools:
                 "export_successful": True
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error exporting CSV: {str(e)}")
+            logger.error("Error exporting CSV: %s", e)
             raise InfoBloxAPIError(f"Failed to export CSV: {str(e)}")
     
     @staticmethod
@@ -730,10 +729,10 @@ class BulkTools:
                 "errors": errors
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error bulk creating A records: {str(e)}")
+            logger.error("Error bulk creating A records: %s", e)
             raise InfoBloxAPIError(f"Failed to bulk create A records: {str(e)}")
     
     @staticmethod
@@ -765,10 +764,10 @@ class BulkTools:
                 "errors": errors
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
             
         except Exception as e:
-            logger.error(f"Error bulk deleting records: {str(e)}")
+            logger.error("Error bulk deleting records: %s", e)
             raise InfoBloxAPIError(f"Failed to bulk delete records: {str(e)}")
 
 
@@ -816,9 +815,9 @@ class SearchTools:
                 "networks": networks
             }
             
-            return json.dumps(result, indent=2)
+            return to_json(result)
 
         except Exception as e:
-            logger.error(f"Error searching by MARSHA EA: {str(e)}")
+            logger.error("Error searching by MARSHA EA: %s", e)
             raise InfoBloxAPIError(f"Failed to search by MARSHA EA: {str(e)}")
 
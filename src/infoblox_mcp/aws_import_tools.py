@@ -1,9 +1,9 @@
 """AWS PVC Import tools for InfoBlox MCP Server."""
 
-import json
 import logging
 from typing import Any, Dict, List, Optional
 from .client import InfoBloxClient, InfoBloxAPIError
+from .json_utils import to_json
 import csv
 import ast
 
@@ -74,7 +74,7 @@ class AWSImportTools:
                 eas_resp = client.search_objects("extensibleattributedef")
                 valid_eas = {ea["name"] for ea in eas_resp}
             except Exception as e:
-                logger.warning(f"Could not fetch EA definitions: {e}. detailed validation disabled.")
+                logger.warning("Could not fetch EA definitions: %s. detailed validation disabled.", e)
                 valid_eas = set()
 
             analysis_results = {
@@ -92,7 +92,7 @@ class AWSImportTools:
                 
                 required_cols = ["CidrBlock", "Tags"]
                 if not all(col in reader.fieldnames for col in required_cols):
-                    return json.dumps({"error": f"Missing required columns. Found: {reader.fieldnames}, Expected at least: {required_cols}"})
+                    return to_json({"error": f"Missing required columns. Found: {reader.fieldnames}, Expected at least: {required_cols}"})
 
                 for row in reader:
                     analysis_results["total_records"] += 1
@@ -140,7 +140,7 @@ class AWSImportTools:
                                         else:
                                             analysis_results["missing_eas"].add(key)
                         except (ValueError, SyntaxError) as e:
-                            logger.warning(f"Failed to parse tags for {cidr}: {e}")
+                            logger.warning("Failed to parse tags for %s: %s", cidr, e)
                     
                     analysis_results["mapped_eas"].update(current_record_eas)
                     
@@ -150,12 +150,12 @@ class AWSImportTools:
             analysis_results["missing_eas"] = list(analysis_results["missing_eas"])
             analysis_results["mapped_eas"] = list(analysis_results["mapped_eas"])
             
-            return json.dumps(analysis_results, indent=2)
+            return to_json(analysis_results)
 
         except FileNotFoundError:
              raise InfoBloxAPIError(f"File not found: {file_name}")
         except Exception as e:
-            logger.error(f"Error analyzing AWS import: {str(e)}")
+            logger.error("Error analyzing AWS import: %s", e)
             raise InfoBloxAPIError(f"Failed to analyze AWS import: {str(e)}")
 
     @staticmethod
@@ -188,7 +188,7 @@ class AWSImportTools:
                 
                 required_cols = ["CidrBlock", "Tags"]
                 if not all(col in reader.fieldnames for col in required_cols):
-                    return json.dumps({"error": "Missing required columns"})
+                    return to_json({"error": "Missing required columns"})
 
                 for row in reader:
                     results["total_records"] += 1
@@ -246,7 +246,7 @@ class AWSImportTools:
                         results["valid_records"] += 1
 
             results["missing_eas"] = list(results["missing_eas"])
-            return json.dumps(results, indent=2)
+            return to_json(results)
 
         except Exception as e:
             raise InfoBloxAPIError(f"Import execution failed: {e}")
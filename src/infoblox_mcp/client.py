@@ -1,18 +1,39 @@
 """InfoBlox API client for WAPI integration."""
 
+import asyncio
+import functools
 import json
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, List, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Union, Callable
 from urllib.parse import urljoin, quote
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from .config import InfoBloxConfig
+from .config import InfoBloxConfig, env_number
 
 
 logger = logging.getLogger(__name__)
 
+# Default number of results per page for paged searches
+DEFAULT_PAGE_SIZE = 1000
+
+# Resolved object references are cached for this many seconds
+REF_CACHE_TTL = 300
+REF_CACHE_MAX_SIZE = 1024
+
+# Upper bound on WAPI requests in flight from the async helpers at once
+MAX_CONCURRENCY = env_number("INFOBLOX_MAX_CONCURRENCY", 16, minimum=1)
+
+# Keep-alive connections kept to the grid master. Sized above the executor
+# concurrency so connections are reused rather than dropped and re-opened
+# (each new connection costs a DNS lookup plus TCP/TLS handshake), and
+# never smaller than it.
+HTTP_POOL_MAXSIZE = env_number("INFOBLOX_HTTP_POOL_SIZE", max(32, 2 * MAX_CONCURRENCY), minimum=MAX_CONCURRENCY)
+
 
 class InfoBloxAPIError(Exception):
     """InfoBlox API specific error."""
@@ -23,6 +44,10 @@ class InfoBloxAPIError(Exception):
         self.response_data = response_data or {}
 
 
+class _LookupAbandoned(Exception):
+    """A shared reference lookup was cancelled by the caller running it."""
+
+
 class InfoBloxClient:
     """InfoBlox WAPI client."""
     
@@ -32,6 +57,19 @@ class InfoBloxClient:
         self.base_url = f"https://{config.grid_master_ip}/wapi/{config.wapi_version}/"
         self.session = requests.Session()
         self.session_cookie = None
+        # (object_type, field, value) -> (_ref, expires_at)
+        self._ref_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Updates and deletes invalidate from worker threads, so every ref
+        # cache read and write holds the lock; the generation (bumped
+        # on every invalidation) stops lookups that overlapped one from
+        # storing a reference that may already be gone
+        self._ref_lock = threading.Lock()
+        self._ref_generation = 0
+        self._ref_inflight: Dict[tuple, "asyncio.Future[Optional[str]]"] = {}
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Worker threads for the async helpers, started on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._setup_session()
         self._authenticate()
     
@@ -45,12 +83,16 @@ class InfoBloxClient:
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=1,
+            pool_maxsize=HTTP_POOL_MAXSIZE
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
-        # Set timeout and SSL verification
-        self.session.timeout = self.config.timeout
+        # SSL verification (the timeout is passed per request, since
+        # requests ignores a timeout set on the session)
         self.session.verify = self.config.verify_ssl
         
         # Set headers
@@ -69,7 +111,8 @@ class InfoBloxClient:
             response = self.session.get(
                 urljoin(self.base_url, "grid"),
                 auth=auth,
-                params={'_return_type': 'json'}
+                params={'_return_type': 'json'},
+                timeout=self.config.timeout
             )
             
             if response.status_code == 200:
@@ -121,7 +164,7 @@ class InfoBloxClient:
         else:
             message = f"{context}: {base_message}"
         
-        logger.error(f"InfoBlox API Error: {message}")
+        logger.error("InfoBlox API Error: %s", message)
         raise InfoBloxAPIError(message, response.status_code, error_data)
     
     def _refresh_session(self):
@@ -135,7 +178,7 @@ class InfoBloxClient:
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Any]]] = None,
         retry_auth: bool = True
     ) -> Dict[str, Any]:
         """Make HTTP request to InfoBlox API."""
@@ -152,12 +195,13 @@ class InfoBloxClient:
             request_data = json.dumps(data)
         
         try:
-            logger.debug(f"Making {method} request to {endpoint}")
+            logger.debug("Making %s request to %s", method, endpoint)
             response = self.session.request(
                 method=method,
                 url=url,
                 params=request_params,
-                data=request_data
+                data=request_data,
+                timeout=self.config.timeout
             )
             
             # Handle authentication errors with retry
@@ -178,7 +222,7 @@ class InfoBloxClient:
             self._handle_error_response(response, f"{method} {endpoint}")
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request exception: {str(e)}")
+            logger.error("Request exception: %s", e)
             raise InfoBloxAPIError(f"Network error: {str(e)}")
     
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -205,7 +249,15 @@ class InfoBloxClient:
                 self.session_cookie = None
                 logger.info("Successfully logged out from InfoBlox")
         except Exception as e:
-            logger.warning(f"Error during logout: {str(e)}")
+            logger.warning("Error during logout: %s", e)
+    
+    def close(self):
+        """Logout and release the pooled connections and worker threads."""
+        self.logout()
+        self.session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def test_connection(self) -> bool:
         """Test connection to InfoBlox."""
@@ -213,7 +265,7 @@ class InfoBloxClient:
             result = self.get("grid")
             return isinstance(result, (list, dict))
         except Exception as e:
-            logger.error(f"Connection test failed: {str(e)}")
+            logger.error("Connection test failed: %s", e)
             return False
     
     # Utility methods for common operations
@@ -224,6 +276,31 @@ class InfoBloxClient:
         result = self.get(object_type, params=params)
         return result if isinstance(result, list) else [result]
     
+    def search_objects_paged(
+        self,
+        object_type: str,
+        search_params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        page_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Search for one page of objects using WAPI paging.
+        
+        Returns a dict with the page's "result" list and the "next_page_id"
+        to pass back for the following page (None on the last page).
+        """
+        if page_id:
+            # The page ID encodes the original query
+            params = {'_page_id': page_id}
+        else:
+            params = dict(search_params or {})
+            params.update({'_paging': 1, '_max_results': page_size, '_return_as_object': 1})
+        
+        page = self.get(object_type, params=params)
+        if isinstance(page, dict) and 'result' in page:
+            return {"result": page['result'], "next_page_id": page.get('next_page_id')}
+        # Not a paged envelope (e.g. paging unsupported for this object)
+        return {"result": page if isinstance(page, list) else [page], "next_page_id": None}
+    
     def get_object_by_ref(self, object_ref: str, return_fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Get object by reference."""
         params = {}
@@ -243,11 +320,196 @@ class InfoBloxClient:
     
     def update_object(self, object_ref: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update existing object."""
-        return self.put(object_ref, data=update_data)
+        result = self.put(object_ref, data=update_data)
+        self._invalidate_ref(object_ref)
+        return result
     
     def delete_object(self, object_ref: str) -> Dict[str, Any]:
         """Delete object by reference."""
-        return self.delete(object_ref)
+        result = self.delete(object_ref)
+        self._invalidate_ref(object_ref)
+        return result
+    
+    def multi_request(self, operations: List[Dict[str, Any]]) -> List[Any]:
+        """Run several WAPI operations in one call via the "request" object.
+        
+        Each entry is a dict with "method", "object" and optional "data";
+        WAPI processes them in order as a single transaction.
+        """
+        result = self._make_request("POST", "request", data=operations)
+        return result if isinstance(result, list) else [result]
+    
+    # Async variants for tool handlers. The blocking call runs in this
+    # client's own executor, sized to MAX_CONCURRENCY (at least 1), so
+    # concurrent tool invocations don't stall the event loop and aren't
+    # capped by (or competing for) the loop's default executor; they all
+    # share this client's pooled requests.Session.
+    
+    async def _run_async(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client method without blocking the event loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix="infoblox-wapi")
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def search_objects_async(self, object_type: str, search_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Search for objects of a specific type (async)."""
+        return await self._run_async(self.search_objects, object_type, search_params)
+    
+    async def search_objects_paged_async(
+        self,
+        object_type: str,
+        search_params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        page_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Search for one page of objects using WAPI paging (async)."""
+        return await self._run_async(self.search_objects_paged, object_type, search_params, page_size, page_id)
+    
+    async def get_object_by_ref_async(self, object_ref: str, return_fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Get object by reference (async)."""
+        return await self._run_async(self.get_object_by_ref, object_ref, return_fields)
+    
+    async def create_object_async(self, object_type: str, object_data: Dict[str, Any]) -> str:
+        """Create new object and return its reference (async)."""
+        return await self._run_async(self.create_object, object_type, object_data)
+    
+    async def multi_request_async(self, operations: List[Dict[str, Any]]) -> List[Any]:
+        """Run several WAPI operations in one call (async)."""
+        return await self._run_async(self.multi_request, operations)
+    
+    async def update_object_async(self, object_ref: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update existing object (async)."""
+        return await self._run_async(self.update_object, object_ref, update_data)
+    
+    async def delete_object_async(self, object_ref: str) -> Dict[str, Any]:
+        """Delete object by reference (async)."""
+        return await self._run_async(self.delete_object, object_ref)
+    
+    async def get_next_available_ip_async(self, network: str, num_ips: int = 1) -> List[str]:
+        """Get next available IP addresses in a network (async)."""
+        return await self._run_async(self.get_next_available_ip, network, num_ips)
+    
+    async def get_network_utilization_async(self, network_ref: str) -> Dict[str, Any]:
+        """Get network utilization statistics (async)."""
+        return await self._run_async(self.get_network_utilization, network_ref)
+    
+    async def resolve_ref_async(self, object_type: str, field: str, value: str, ttl: float = REF_CACHE_TTL) -> Optional[str]:
+        """Resolve an object's _ref by searching on one field, with a TTL cache.
+        
+        Returns None if no object matches.
+        """
+        key = (object_type, field, value)
+        while True:
+            ref = self._cached_ref(key, time.monotonic())
+            if ref is not None:
+                return ref
+            
+            # Single-flight: concurrent lookups of the same key share one search
+            pending = self._ref_inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except _LookupAbandoned:
+                # The lookup we joined was cancelled; start over
+                continue
+        
+        future = asyncio.get_running_loop().create_future()
+        self._ref_inflight[key] = future
+        generation = self._ref_generation
+        try:
+            objects = await self.search_objects_async(object_type, {field: value})
+            ref = objects[0]["_ref"] if objects else None
+            if ref is not None:
+                self._cache_ref(key, ref, ttl, generation)
+            future.set_result(ref)
+            return ref
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; send anyone waiting on the
+            # shared lookup back to retry it rather than cancelling them too
+            future.set_exception(_LookupAbandoned())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure isn't logged by asyncio
+            future.exception()
+            raise
+        finally:
+            del self._ref_inflight[key]
+    
+    async def resolve_refs_async(
+        self,
+        object_type: str,
+        field: str,
+        values: List[str],
+        ttl: float = REF_CACHE_TTL
+    ) -> Dict[str, Optional[str]]:
+        """Resolve _refs for several values of one field.
+        
+        Cache misses are looked up together in a single WAPI multi-object
+        request. Returns a mapping of value to ref (None if not found).
+        """
+        refs: Dict[str, Optional[str]] = {}
+        misses = []
+        now = time.monotonic()
+        for value in dict.fromkeys(values):
+            ref = self._cached_ref((object_type, field, value), now)
+            if ref is not None:
+                refs[value] = ref
+            else:
+                misses.append(value)
+        
+        if misses:
+            generation = self._ref_generation
+            results = await self.multi_request_async([
+                {"method": "GET", "object": object_type, "data": {field: value}}
+                for value in misses
+            ])
+            for value, objects in zip(misses, results):
+                ref = objects[0]["_ref"] if isinstance(objects, list) and objects else None
+                if ref is not None:
+                    self._cache_ref((object_type, field, value), ref, ttl, generation)
+                refs[value] = ref
+        return refs
+    
+    def _cached_ref(self, key: tuple, now: float) -> Optional[str]:
+        """Return an unexpired cached reference, marking it recently used."""
+        with self._ref_lock:
+            cached = self._ref_cache.get(key)
+            if cached is None:
+                return None
+            if cached[1] <= now:
+                del self._ref_cache[key]
+                return None
+            self._ref_cache.move_to_end(key)
+            return cached[0]
+    
+    def _cache_ref(self, key: tuple, ref: str, ttl: float, generation: int):
+        """Store a resolved reference, evicting the least recently used entry when full.
+        
+        Skipped if an update or delete completed since the lookup began
+        (generation is the value of _ref_generation when it started).
+        """
+        with self._ref_lock:
+            if generation != self._ref_generation:
+                return
+            self._ref_cache[key] = (ref, time.monotonic() + ttl)
+            self._ref_cache.move_to_end(key)
+            if len(self._ref_cache) > REF_CACHE_MAX_SIZE:
+                self._ref_cache.popitem(last=False)
+    
+    def _invalidate_ref(self, object_ref: str):
+        """Drop cached lookups that resolved to the given reference."""
+        with self._ref_lock:
+            self._ref_generation += 1
+            stale = [key for key, (ref, _) in self._ref_cache.items() if ref == object_ref]
+            for key in stale:
+                del self._ref_cache[key]
     
     def get_next_available_ip(self, network: str, num_ips: int = 1) -> List[str]:
         """Get next available IP addresses in a network."""
@@ -342,5 +604,5 @@ class InfoBloxClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.logout()
+        self.close()
 
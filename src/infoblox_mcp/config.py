@@ -1,16 +1,54 @@
 """Configuration management for InfoBlox MCP Server."""
 
 import json
+import logging
 import os
 import getpass
+import tempfile
 import click
 from pathlib import Path
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
-from cryptography.fernet import Fernet
+from typing import Optional, Dict, Any, Set, Union, Callable
+from pydantic import BaseModel, Field, field_validator
 from .error_handling import ConfigurationError, validate_ip_address
 
 
+logger = logging.getLogger(__name__)
+
+
+def env_number(name: str, default: Union[int, float], minimum: Union[int, float], cast: Callable = int) -> Any:
+    """Read a numeric tuning setting from the environment.
+    
+    Used for module-level settings read at import time: an unparseable
+    value falls back to default and one below minimum is raised to it,
+    with a warning, rather than stopping the server from starting.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        value = default
+    else:
+        try:
+            value = cast(raw)
+        except ValueError:
+            logger.warning("Ignoring %s=%r: not a number, using %s", name, raw, default)
+            value = default
+    # Written so NaN fails the check too
+    if not value >= minimum:
+        if raw is not None:
+            logger.warning("%s=%r is below %s, using %s", name, raw, minimum, minimum)
+        value = minimum
+    return value
+
+def _env_int(env: Dict[str, str], name: str, default: int) -> int:
+    """Read an optional integer setting from the environment."""
+    value = env.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ConfigurationError(f"{name} must be an integer, got {value!r}") from None
+
+
 class InfoBloxConfig(BaseModel):
     """InfoBlox configuration model."""
     
@@ -34,27 +72,25 @@ class InfoBloxConfig(BaseModel):
     llm_model: str = Field(default="gpt-4o", description="LLM Model Name")
     llm_base_url: str = Field(default="https://api.openai.com/v1", description="LLM Base URL")
 
-    @validator('grid_master_ip')
+    @field_validator('grid_master_ip')
+    @classmethod
     def validate_ip(cls, v):
-        """Validate IP address format."""
-        import ipaddress
-        try:
-            ipaddress.ip_address(v)
-            return v
-        except ValueError:
-            # Could be hostname/FQDN
-            if not v or len(v.strip()) == 0:
-                raise ValueError("Grid Master IP cannot be empty")
-            return v.strip()
+        """Validate the Grid Master address; an IP address or a hostname/FQDN."""
+        v = v.strip()
+        if not v:
+            raise ValueError("Grid Master IP cannot be empty")
+        return v
     
-    @validator('wapi_version')
+    @field_validator('wapi_version')
+    @classmethod
     def validate_wapi_version(cls, v):
         """Validate WAPI version format."""
         if not v.startswith('v'):
             v = f"v{v}"
         return v
     
-    @validator('log_level')
+    @field_validator('log_level')
+    @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
@@ -72,33 +108,95 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
         self.config_file = self.config_dir / "config.json"
         self.key_file = self.config_dir / "key.key"
+        # Names in config_dir and the directory mtime they were listed at
+        self._existing: Optional[Set[str]] = None
+        self._existing_mtime: Optional[int] = None
         self._encryption_key = self._get_or_create_key()
+        self._fernet = None
         self._config: Optional[InfoBloxConfig] = None
+        # Last plaintext/ciphertext pair, so saves that don't touch the
+        # password skip the Fernet round-trip
+        self._last_password_plain: Optional[str] = None
+        self._last_password_cipher: Optional[str] = None
+    
+    def _file_exists(self, path: Path) -> bool:
+        """Check whether a file exists in the config directory.
+        
+        The directory listing is reused while the directory's mtime is
+        unchanged. The methods that create or delete files drop it, and a
+        name missing from it triggers a fresh listing, so files created by
+        setup_config.py or another process are picked up.
+        """
+        mtime = os.stat(self.config_dir).st_mtime_ns
+        if self._existing is None or mtime != self._existing_mtime or path.name not in self._existing:
+            with os.scandir(self.config_dir) as entries:
+                self._existing = {entry.name for entry in entries}
+            self._existing_mtime = mtime
+        return path.name in self._existing
     
     def _get_or_create_key(self) -> bytes:
         """Get or create encryption key."""
-        if self.key_file.exists():
-            return self.key_file.read_bytes()
-        else:
-            key = Fernet.generate_key()
-            self.key_file.write_bytes(key)
-            # Set restrictive permissions
-            os.chmod(self.key_file, 0o600)
-            return key
+        if not self.key_file.exists():
+            # The key is written and fsynced under a temporary name, then
+            # hard-linked into place: the link fails if another process got
+            # there first, and the key file is never seen partly written.
+            # mkstemp creates the file with 0600 permissions.
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix=".key-", suffix=".tmp")
+            try:
+                try:
+                    # Imported lazily; cryptography is slow to import and
+                    # most commands never need it
+                    from cryptography.fernet import Fernet
+                    os.write(fd, Fernet.generate_key())
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                try:
+                    os.link(tmp_path, self.key_file)
+                except FileExistsError:
+                    pass  # Another process created the key first; use theirs
+            finally:
+                os.unlink(tmp_path)
+            self._existing = None
+        key = self.key_file.read_bytes()
+        if not key.strip():
+            # Left by an interrupted write from an older version; nothing
+            # can have been encrypted with it
+            raise ConfigurationError(f"Encryption key file {self.key_file} is empty; delete it to generate a new key")
+        return key
+    
+    def _get_fernet(self):
+        """Get the Fernet instance for the encryption key, creating it on first use."""
+        if self._fernet is None:
+            from cryptography.fernet import Fernet
+            self._fernet = Fernet(self._encryption_key)
+        return self._fernet
     
     def _encrypt_password(self, password: str) -> str:
         """Encrypt password."""
-        fernet = Fernet(self._encryption_key)
-        return fernet.encrypt(password.encode()).decode()
+        if password == self._last_password_plain and self._last_password_cipher is not None:
+            return self._last_password_cipher
+        fernet = self._get_fernet()
+        # Fernet tokens are URL-safe base64, so ASCII is sufficient
+        encrypted_password = fernet.encrypt(password.encode()).decode('ascii')
+        self._last_password_plain = password
+        self._last_password_cipher = encrypted_password
+        return encrypted_password
     
     def _decrypt_password(self, encrypted_password: str) -> str:
         """Decrypt password."""
-        fernet = Fernet(self._encryption_key)
-        return fernet.decrypt(encrypted_password.encode()).decode()
+        if encrypted_password == self._last_password_cipher and self._last_password_plain is not None:
+            return self._last_password_plain
+        fernet = self._get_fernet()
+        # Fernet accepts the str token directly; no need to re-encode it
+        password = fernet.decrypt(encrypted_password).decode()
+        self._last_password_plain = password
+        self._last_password_cipher = encrypted_password
+        return password
     
     def load_config(self) -> Optional[InfoBloxConfig]:
         """Load configuration from file."""
-        if not self.config_file.exists():
+        if not self._file_exists(self.config_file):
             return None
         
         try:
@@ -109,32 +207,89 @@ class ConfigManager:
             if 'password' in config_data:
                 config_data['password'] = self._decrypt_password(config_data['password'])
             
-            self._config = InfoBloxConfig(**config_data)
+            self._config = InfoBloxConfig.model_validate(config_data)
             return self._config
         except Exception as e:
             click.echo(f"Error loading configuration: {e}", err=True)
             return None
     
+    def get_field(self, name: str, default: Any = None) -> Any:
+        """Read a single field from the saved configuration.
+        
+        Skips model validation and only decrypts when the password itself
+        is requested, for callers that need one value (e.g. log_level).
+        """
+        if not self._file_exists(self.config_file):
+            return default
+        
+        try:
+            with open(self.config_file, 'r') as f:
+                value = json.load(f).get(name, default)
+            if name == 'password' and value:
+                value = self._decrypt_password(value)
+            return value
+        except Exception as e:
+            click.echo(f"Error reading configuration field {name}: {e}", err=True)
+            return default
+    
     def save_config(self, config: InfoBloxConfig) -> bool:
         """Save configuration to file."""
         try:
-            config_data = config.dict()
-            # Encrypt password before saving
-            config_data['password'] = self._encrypt_password(config_data['password'])
-            
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
-            
-            # Set restrictive permissions
-            os.chmod(self.config_file, 0o600)
+            # Encrypt password before saving (reuses the previous ciphertext
+            # when the password is unchanged) and serialize in one pass.
+            # The file is written compact; use export_config() for a
+            # human-readable copy.
+            encrypted = config.model_copy(
+                update={'password': self._encrypt_password(config.password)}
+            )
+            self._write_config_text(encrypted.model_dump_json())
             self._config = config
             return True
         except Exception as e:
             click.echo(f"Error saving configuration: {e}", err=True)
             return False
     
+    def export_config(self) -> Optional[str]:
+        """Export the saved configuration as indented JSON, without secrets."""
+        config = self.load_config()
+        if config is None:
+            return None
+        return config.model_dump_json(
+            indent=2,
+            exclude={'password', 'splunk_token', 'splunk_password', 'llm_api_key'}
+        )
+    
+    def _write_config_text(self, config_text: str):
+        """Write already-encrypted, serialized configuration to file."""
+        with open(self.config_file, 'w') as f:
+            f.write(config_text)
+        
+        # Set restrictive permissions
+        os.chmod(self.config_file, 0o600)
+        self._existing = None
+    
     def prompt_for_config(self) -> InfoBloxConfig:
-        """Prompt user for configuration."""
+        """Prompt user for configuration.
+        
+        If INFOBLOX_GRID_MASTER_IP, INFOBLOX_USERNAME and INFOBLOX_PASSWORD
+        are all set, the configuration is built from the environment without
+        prompting. INFOBLOX_WAPI_VERSION, INFOBLOX_VERIFY_SSL,
+        INFOBLOX_TIMEOUT, INFOBLOX_MAX_RETRIES and INFOBLOX_LOG_LEVEL are
+        optional and fall back to the usual defaults.
+        """
+        env = os.environ
+        if all(var in env for var in ('INFOBLOX_GRID_MASTER_IP', 'INFOBLOX_USERNAME', 'INFOBLOX_PASSWORD')):
+            return InfoBloxConfig(
+                grid_master_ip=env['INFOBLOX_GRID_MASTER_IP'],
+                username=env['INFOBLOX_USERNAME'],
+                password=env['INFOBLOX_PASSWORD'],
+                wapi_version=env.get('INFOBLOX_WAPI_VERSION', "v2.13.6"),
+                verify_ssl=env.get('INFOBLOX_VERIFY_SSL', "true").strip().lower() not in ('0', 'false', 'no', 'off'),
+                timeout=_env_int(env, 'INFOBLOX_TIMEOUT', 30),
+                max_retries=_env_int(env, 'INFOBLOX_MAX_RETRIES', 3),
+                log_level=env.get('INFOBLOX_LOG_LEVEL', "INFO")
+            )
+        
         click.echo("InfoBlox MCP Server Configuration")
         click.echo("=" * 40)
         
@@ -247,12 +402,16 @@ class ConfigManager:
         if self._config is None:
             self._config = self.get_config()
         
+        # Nothing to validate or write if every value is already current
+        if all(getattr(self._config, key, object()) == value for key, value in kwargs.items()):
+            return True
+        
         # Create updated config
-        config_data = self._config.dict()
+        config_data = self._config.model_dump()
         config_data.update(kwargs)
         
         try:
-            updated_config = InfoBloxConfig(**config_data)
+            updated_config = InfoBloxConfig.model_validate(config_data)
             return self.save_config(updated_config)
         except Exception as e:
             click.echo(f"Error updating configuration: {e}", err=True)
@@ -261,11 +420,15 @@ class ConfigManager:
     def reset_config(self) -> bool:
         """Reset configuration (delete config files)."""
         try:
-            if self.config_file.exists():
+            if self._file_exists(self.config_file):
                 self.config_file.unlink()
-            if self.key_file.exists():
+                self._existing = None
+            if self._file_exists(self.key_file):
                 self.key_file.unlink()
+                self._existing = None
             self._config = None
+            self._last_password_plain = None
+            self._last_password_cipher = None
             return True
         except Exception as e:
             click.echo(f"Error resetting configuration: {e}", err=True)
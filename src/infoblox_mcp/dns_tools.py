@@ -1,13 +1,172 @@
 """Extended tool implementations for InfoBlox MCP Server - DNS Tools."""
 
-import json
+import asyncio
+import ipaddress
 import logging
-from typing import Any, Dict, List, Optional
-from .client import InfoBloxClient, InfoBloxAPIError
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from .client import InfoBloxClient, InfoBloxAPIError, DEFAULT_PAGE_SIZE
+from .error_handling import ValidationError
+from .json_utils import to_json
+from .tool_utils import PAGE_ID_PROPERTY, PAGE_SIZE_PROPERTY, page_json, pick, success_json, tool_handler
 
 
 logger = logging.getLogger(__name__)
 
+# Required fields per record type for the create tools; the common
+# optional fields are copied when present.
+_RECORD_FIELDS = {
+    "a": ("name", "ipv4addr"),
+    "aaaa": ("name", "ipv6addr"),
+    "host": ("name", "ipv4addrs"),
+    "cname": ("name", "canonical"),
+    "mx": ("name", "mail_exchanger", "preference"),
+    "ptr": ("ipv4addr", "ptrdname"),
+    "srv": ("name", "target", "port", "priority", "weight"),
+    "txt": ("name", "text"),
+}
+_RECORD_OPTIONAL = ("view", "ttl", "comment")
+_RECORD_KEYS = {record_type: required + _RECORD_OPTIONAL for record_type, required in _RECORD_FIELDS.items()}
+_VIEW_OPTIONAL = ("comment",)
+_RPZ_FILTERS = ("view",)
+_RPZ_OPTIONAL = ("view", "comment")
+
+# Zone names: RFC 1123 labels (underscores allowed for e.g. _msdcs zones).
+# Used with fullmatch: "$" would also accept a trailing newline.
+_FQDN_RE = re.compile(r"(?=.{1,253}\.?\Z)(?!-)[A-Za-z0-9_-]{1,63}(?<!-)(?:\.(?!-)[A-Za-z0-9_-]{1,63}(?<!-))*\.?")
+
+
+def _is_fqdn(value: Any) -> bool:
+    """Check whether a value is a syntactically valid FQDN."""
+    return isinstance(value, str) and _FQDN_RE.fullmatch(value) is not None
+
+
+def _is_address(version: int, value: Any) -> bool:
+    """Check whether a value is an IP address of the given version."""
+    try:
+        return ipaddress.ip_address(value).version == version
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_hostname(value: Any) -> bool:
+    """Check whether a value is a hostname target ("." means none, e.g. null MX)."""
+    return value == "." or _is_fqdn(value)
+
+
+def _is_host_addresses(value: Any) -> bool:
+    """Check a host record's ipv4addrs: a non-empty list of {"ipv4addr": ...} objects."""
+    return (
+        isinstance(value, list)
+        and len(value) > 0
+        and all(isinstance(item, dict) and _is_address(4, item.get("ipv4addr")) for item in value)
+    )
+
+
+# Record fields checked locally so obviously bad values never reach WAPI
+_FIELD_CHECKS = {
+    "ipv4addr": lambda value: _is_address(4, value),
+    "ipv4addrs": _is_host_addresses,
+    "ipv6addr": lambda value: _is_address(6, value),
+    "canonical": _is_hostname,
+    "mail_exchanger": _is_hostname,
+    "ptrdname": _is_hostname,
+    "target": _is_hostname,
+}
+
+
+# Response for mutations with nothing further to report
+_OK_JSON = to_json({"success": True})
+
+
+def _build_record_data(record_type: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the WAPI object data for creating a record of the given type."""
+    try:
+        required = _RECORD_FIELDS[record_type]
+    except KeyError:
+        raise ValidationError(f"Unsupported record type: {record_type}")
+    
+    missing = [field for field in required if field not in args]
+    if missing:
+        raise ValidationError(f"Missing fields for {record_type} record: {', '.join(missing)}")
+    
+    for field in required:
+        check = _FIELD_CHECKS.get(field)
+        if check is not None and not check(args[field]):
+            raise ValidationError(f"Invalid {field}: {args[field]}")
+    
+    # Required fields are known present, so one pass picks up everything
+    return pick(args, _RECORD_KEYS[record_type])
+
+
+def _build_bulk_operations(records: Any) -> List[Dict[str, Any]]:
+    """Check each bulk record item and build its WAPI multi-request operation."""
+    operations = []
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValidationError(f"Record {index} must be an object with 'type' and 'data'")
+        record_type = record.get("type")
+        data = record.get("data")
+        if record_type not in _RECORD_FIELDS:
+            raise ValidationError(f"Record {index}: unsupported record type: {record_type}")
+        if not isinstance(data, dict):
+            raise ValidationError(f"Record {index}: 'data' must be an object")
+        try:
+            record_data = _build_record_data(record_type, data)
+        except ValidationError as e:
+            raise ValidationError(f"Record {index}: {e}") from e
+        operations.append({"method": "POST", "object": f"record:{record_type}", "data": record_data})
+    return operations
+
+
+def _make_create_record_handler(record_type: str) -> Callable[..., Awaitable[str]]:
+    """Build the create tool handler for one record type.
+    
+    The response echoes the record's required fields alongside its reference.
+    """
+    required = _RECORD_FIELDS[record_type]
+    wapi_object = f"record:{record_type}"
+    label = record_type.upper()
+    
+    async def handler(args: Dict[str, Any], client: InfoBloxClient) -> str:
+        record_data = _build_record_data(record_type, args)
+        record_ref = await client.create_object_async(wapi_object, record_data)
+        
+        return success_json(
+            record_reference=record_ref,
+            **{field: args[field] for field in required}
+        )
+    
+    handler.__name__ = handler.__qualname__ = f"_create_record_{record_type}"
+    handler.__doc__ = f"Create DNS {label} record."
+    return tool_handler(f"create DNS {label} record")(handler)
+
+
+def _is_network(value: str) -> bool:
+    """Check whether a value is an IPv4/IPv6 network in CIDR notation."""
+    try:
+        ipaddress.ip_network(value, strict=False)
+    except ValueError:
+        return False
+    return "/" in value
+
+
+async def _resolve_zone_ref(zone_ref: str, client: InfoBloxClient) -> str:
+    """Return the zone_auth reference for a zone given as a reference or FQDN."""
+    if zone_ref.startswith("zone_auth/"):
+        return zone_ref
+    
+    # Reject malformed names locally instead of spending a WAPI search on them;
+    # reverse zones are named by their network (e.g. 10.0.0.0/24)
+    if not _is_fqdn(zone_ref) and not _is_network(zone_ref):
+        raise ValidationError(f"Invalid zone identifier: {zone_ref}")
+    
+    # Cached on the client; deleting the zone drops the cached entry
+    resolved_ref = await client.resolve_ref_async("zone_auth", "fqdn", zone_ref)
+    if not resolved_ref:
+        raise InfoBloxAPIError(f"Zone {zone_ref} not found")
+    return resolved_ref
+
 
 class DNSTools:
     """DNS management tools for InfoBlox."""
@@ -15,740 +174,568 @@ class DNSTools:
     @staticmethod
     def register_tools(registry):
         """Register all DNS tools."""
+        for name, description, parameters, handler in _DNS_TOOL_SPECS:
+            registry.register_tool(name, description, parameters, handler)
+    
+    # Implementation methods
+    
+    @staticmethod
+    @tool_handler("delete DNS zone")
+    async def _delete_zone(args: Dict[str, Any], client: InfoBloxClient) -> str:
+        """Delete DNS zone."""
+        zone_ref = await _resolve_zone_ref(args["zone_ref"], client)
         
-        # Zone Management Tools
-        registry.register_tool(
-            "infoblox_dns_delete_zone",
-            "Delete a DNS zone",
-            {
-                "type": "object",
-                "properties": {
-                    "zone_ref": {
-                        "type": "string",
-                        "description": "Zone reference (from list_zones) or FQDN"
-                    }
-                },
-                "required": ["zone_ref"]
-            },
-            DNSTools._delete_zone
-        )
-        
-        registry.register_tool(
-            "infoblox_dns_get_zone_details",
-            "Get detailed information about a DNS zone",
-            {
-                "type": "object",
-                "properties": {
-                    "zone_ref": {
-                        "type": "string",
-                        "description": "Zone reference or FQDN"
-                    }
-                },
-                "required": ["zone_ref"]
-            },
-            DNSTools._get_zone_details
-        )
-        
-        # DNS Record Management - AAAA Records
-        registry.register_tool(
-            "infoblox_dns_create_record_aaaa",
-            "Create a DNS AAAA record (IPv6)",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Record name (hostname)"
-                    },
-                    "ipv6addr": {
-                        "type": "string",
-                        "description": "IPv6 address"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["name", "ipv6addr"]
-            },
-            DNSTools._create_record_aaaa
-        )
-        
-        # CNAME Records
-        registry.register_tool(
-            "infoblox_dns_create_record_cname",
-            "Create a DNS CNAME record",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Record name (alias)"
-                    },
-                    "canonical": {
-                        "type": "string",
-                        "description": "Canonical name (target)"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["name", "canonical"]
-            },
-            DNSTools._create_record_cname
-        )
-        
-        # MX Records
-        registry.register_tool(
-            "infoblox_dns_create_record_mx",
-            "Create a DNS MX record",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Domain name"
-                    },
-                    "mail_exchanger": {
-                        "type": "string",
-                        "description": "Mail exchanger hostname"
-                    },
-                    "preference": {
-                        "type": "integer",
-                        "description": "MX preference value",
-                        "minimum": 0,
-                        "maximum": 65535
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["name", "mail_exchanger", "preference"]
-            },
-            DNSTools._create_record_mx
-        )
-        
-        # PTR Records
-        registry.register_tool(
-            "infoblox_dns_create_record_ptr",
-            "Create a DNS PTR record (reverse lookup)",
-            {
-                "type": "object",
-                "properties": {
-                    "ipv4addr": {
-                        "type": "string",
-                        "description": "IPv4 address for reverse lookup"
-                    },
-                    "ptrdname": {
-                        "type": "string",
-                        "description": "Domain name for the PTR record"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["ipv4addr", "ptrdname"]
-            },
-            DNSTools._create_record_ptr
-        )
+        await client.delete_object_async(zone_ref)
         
-        # SRV Records
-        registry.register_tool(
-            "infoblox_dns_create_record_srv",
-            "Create a DNS SRV record",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Service name (e.g., _sip._tcp.example.com)"
-                    },
-                    "target": {
-                        "type": "string",
-                        "description": "Target hostname"
-                    },
-                    "port": {
-                        "type": "integer",
-                        "description": "Port number",
-                        "minimum": 0,
-                        "maximum": 65535
-                    },
-                    "priority": {
-                        "type": "integer",
-                        "description": "Priority value",
-                        "minimum": 0,
-                        "maximum": 65535
-                    },
-                    "weight": {
-                        "type": "integer",
-                        "description": "Weight value",
-                        "minimum": 0,
-                        "maximum": 65535
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["name", "target", "port", "priority", "weight"]
-            },
-            DNSTools._create_record_srv
-        )
-        
-        # TXT Records
-        registry.register_tool(
-            "infoblox_dns_create_record_txt",
-            "Create a DNS TXT record",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Record name"
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Text content"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["name", "text"]
-            },
-            DNSTools._create_record_txt
+        if not args.get("verbose"):
+            return _OK_JSON
+        return success_json(
+            message=f"Zone {args['zone_ref']} deleted successfully"
         )
+    
+    @staticmethod
+    @tool_handler("delete DNS zones")
+    async def _delete_zones(args: Dict[str, Any], client: InfoBloxClient) -> str:
+        """Delete several DNS zones concurrently, reporting the outcome per zone."""
+        zone_refs = args["zone_refs"]
         
-        # Record Management
-        registry.register_tool(
-            "infoblox_dns_update_record",
-            "Update an existing DNS record",
-            {
-                "type": "object",
-                "properties": {
-                    "record_ref": {
-                        "type": "string",
-                        "description": "Record reference (from search results)"
-                    },
-                    "updates": {
-                        "type": "object",
-                        "description": "Fields to update (varies by record type)",
-                        "additionalProperties": True
-                    }
-                },
-                "required": ["record_ref", "updates"]
-            },
-            DNSTools._update_record
-        )
+        # Resolve all zone names in one WAPI request; anything left
+        # over (refs, malformed names) goes through _resolve_zone_ref
+        names = [
+            zone_ref for zone_ref in zone_refs
+            if not zone_ref.startswith("zone_auth/") and (_is_fqdn(zone_ref) or _is_network(zone_ref))
+        ]
+        resolved: Dict[str, Optional[str]] = {}
+        if names:
+            try:
+                resolved = await client.resolve_refs_async("zone_auth", "fqdn", names)
+            except InfoBloxAPIError as e:
+                logger.warning("Batched zone lookup failed, resolving one by one: %s", e)
         
-        registry.register_tool(
-            "infoblox_dns_delete_record",
-            "Delete a DNS record",
-            {
-                "type": "object",
-                "properties": {
-                    "record_ref": {
-                        "type": "string",
-                        "description": "Record reference (from search results)"
-                    }
-                },
-                "required": ["record_ref"]
-            },
-            DNSTools._delete_record
-        )
+        async def delete_one(zone_ref: str) -> None:
+            if zone_ref in resolved:
+                ref = resolved[zone_ref]
+                if ref is None:
+                    raise InfoBloxAPIError(f"Zone {zone_ref} not found")
+            else:
+                ref = await _resolve_zone_ref(zone_ref, client)
+            await client.delete_object_async(ref)
         
-        # DNS Views
-        registry.register_tool(
-            "infoblox_dns_list_views",
-            "List all DNS views",
-            {
-                "type": "object",
-                "properties": {}
-            },
-            DNSTools._list_views
+        outcomes = await asyncio.gather(
+            *(delete_one(zone_ref) for zone_ref in zone_refs),
+            return_exceptions=True
         )
         
-        registry.register_tool(
-            "infoblox_dns_create_view",
-            "Create a new DNS view",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "View name"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the view (optional)"
-                    }
-                },
-                "required": ["name"]
-            },
-            DNSTools._create_view
-        )
+        results = []
+        for zone_ref, outcome in zip(zone_refs, outcomes):
+            if isinstance(outcome, Exception):
+                results.append({"zone": zone_ref, "success": False, "error": str(outcome)})
+            else:
+                results.append({"zone": zone_ref, "success": True})
         
-        # Response Policy Zones (RPZ)
-        registry.register_tool(
-            "infoblox_dns_list_rpz_zones",
-            "List Response Policy Zones",
-            {
-                "type": "object",
-                "properties": {
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional)"
-                    }
-                }
-            },
-            DNSTools._list_rpz_zones
-        )
+        deleted = sum(1 for entry in results if entry["success"])
+        result = {
+            "success": deleted == len(results),
+            "deleted": deleted,
+            "failed": len(results) - deleted,
+            "results": results
+        }
         
-        registry.register_tool(
-            "infoblox_dns_create_rpz_zone",
-            "Create a Response Policy Zone",
-            {
-                "type": "object",
-                "properties": {
-                    "fqdn": {
-                        "type": "string",
-                        "description": "RPZ zone FQDN"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the RPZ zone (optional)"
-                    }
-                },
-                "required": ["fqdn"]
-            },
-            DNSTools._create_rpz_zone
-        )
-    
-    # Implementation methods
-    
-    @staticmethod
-    async def _delete_zone(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Delete DNS zone."""
-        try:
-            zone_ref = args["zone_ref"]
-            
-            # If it's not a reference, try to find the zone
-            if not zone_ref.startswith("zone_auth/"):
-                zones = client.search_objects("zone_auth", {"fqdn": zone_ref})
-                if not zones:
-                    raise InfoBloxAPIError(f"Zone {zone_ref} not found")
-                zone_ref = zones[0]["_ref"]
-            
-            client.delete_object(zone_ref)
-            
-            result = {
-                "success": True,
-                "message": f"Zone {args['zone_ref']} deleted successfully"
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error deleting DNS zone: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to delete DNS zone: {str(e)}")
+        return to_json(result)
     
     @staticmethod
+    @tool_handler("get zone details")
     async def _get_zone_details(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Get zone details."""
-        try:
-            zone_ref = args["zone_ref"]
-            
-            # If it's not a reference, try to find the zone
-            if not zone_ref.startswith("zone_auth/"):
-                zones = client.search_objects("zone_auth", {"fqdn": zone_ref})
-                if not zones:
-                    raise InfoBloxAPIError(f"Zone {zone_ref} not found")
-                zone_ref = zones[0]["_ref"]
-            
-            zone_details = client.get_object_by_ref(zone_ref)
-            
-            return json.dumps(zone_details, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error getting zone details: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to get zone details: {str(e)}")
-    
-    @staticmethod
-    async def _create_record_aaaa(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Create DNS AAAA record."""
-        try:
-            record_data = {
-                "name": args["name"],
-                "ipv6addr": args["ipv6addr"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:aaaa", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "name": args["name"],
-                "ipv6addr": args["ipv6addr"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS AAAA record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS AAAA record: {str(e)}")
-    
-    @staticmethod
-    async def _create_record_cname(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Create DNS CNAME record."""
-        try:
-            record_data = {
-                "name": args["name"],
-                "canonical": args["canonical"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:cname", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "name": args["name"],
-                "canonical": args["canonical"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS CNAME record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS CNAME record: {str(e)}")
-    
-    @staticmethod
-    async def _create_record_mx(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Create DNS MX record."""
-        try:
-            record_data = {
-                "name": args["name"],
-                "mail_exchanger": args["mail_exchanger"],
-                "preference": args["preference"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:mx", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "name": args["name"],
-                "mail_exchanger": args["mail_exchanger"],
-                "preference": args["preference"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS MX record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS MX record: {str(e)}")
-    
-    @staticmethod
-    async def _create_record_ptr(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Create DNS PTR record."""
-        try:
-            record_data = {
-                "ipv4addr": args["ipv4addr"],
-                "ptrdname": args["ptrdname"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:ptr", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "ipv4addr": args["ipv4addr"],
-                "ptrdname": args["ptrdname"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS PTR record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS PTR record: {str(e)}")
+        zone_ref = await _resolve_zone_ref(args["zone_ref"], client)
+        
+        zone_details = await client.get_object_by_ref_async(zone_ref)
+        
+        return to_json(zone_details)
     
-    @staticmethod
-    async def _create_record_srv(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Create DNS SRV record."""
-        try:
-            record_data = {
-                "name": args["name"],
-                "target": args["target"],
-                "port": args["port"],
-                "priority": args["priority"],
-                "weight": args["weight"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:srv", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "name": args["name"],
-                "target": args["target"],
-                "port": args["port"],
-                "priority": args["priority"],
-                "weight": args["weight"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS SRV record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS SRV record: {str(e)}")
+    # Record create handlers, generated from _RECORD_FIELDS
+    _create_record_aaaa = staticmethod(_make_create_record_handler("aaaa"))
+    _create_record_cname = staticmethod(_make_create_record_handler("cname"))
+    _create_record_mx = staticmethod(_make_create_record_handler("mx"))
+    _create_record_ptr = staticmethod(_make_create_record_handler("ptr"))
+    _create_record_srv = staticmethod(_make_create_record_handler("srv"))
+    _create_record_txt = staticmethod(_make_create_record_handler("txt"))
     
     @staticmethod
-    async def _create_record_txt(args: Dict[str, Any], client: InfoBloxClient) -> str:
-        """Create DNS TXT record."""
-        try:
-            record_data = {
-                "name": args["name"],
-                "text": args["text"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:txt", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "name": args["name"],
-                "text": args["text"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS TXT record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS TXT record: {str(e)}")
+    @tool_handler("bulk create DNS records")
+    async def _bulk_create_records(args: Dict[str, Any], client: InfoBloxClient) -> str:
+        """Create several DNS records in one WAPI multi-object request."""
+        # Every item is checked before anything is sent
+        operations = _build_bulk_operations(args["records"])
+        
+        refs = await client.multi_request_async(operations)
+        
+        return success_json(
+            record_references=refs,
+            count=len(refs)
+        )
     
     @staticmethod
+    @tool_handler("update DNS record")
     async def _update_record(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Update DNS record."""
-        try:
-            record_ref = args["record_ref"]
-            updates = args["updates"]
-            
-            result = client.update_object(record_ref, updates)
-            
-            return json.dumps({
-                "success": True,
-                "record_reference": record_ref,
-                "updates": updates,
-                "result": result
-            }, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error updating DNS record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to update DNS record: {str(e)}")
+        record_ref = args["record_ref"]
+        updates = args["updates"]
+        
+        result = await client.update_object_async(record_ref, updates)
+        
+        # The caller already has the updates; only the (possibly renamed)
+        # reference WAPI returns is new information
+        return success_json(
+            record_reference=result if isinstance(result, str) else record_ref
+        )
     
     @staticmethod
+    @tool_handler("delete DNS record")
     async def _delete_record(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Delete DNS record."""
-        try:
-            record_ref = args["record_ref"]
-            
-            client.delete_object(record_ref)
-            
-            result = {
-                "success": True,
-                "message": f"Record {record_ref} deleted successfully"
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error deleting DNS record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to delete DNS record: {str(e)}")
+        record_ref = args["record_ref"]
+        
+        await client.delete_object_async(record_ref)
+        
+        if not args.get("verbose"):
+            return _OK_JSON
+        return success_json(
+            message=f"Record {record_ref} deleted successfully"
+        )
     
     @staticmethod
+    @tool_handler("list DNS views")
     async def _list_views(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """List DNS views."""
-        try:
-            views = client.search_objects("view")
-            
-            result = {
-                "views": views,
-                "count": len(views)
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error listing DNS views: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to list DNS views: {str(e)}")
+        page = await client.search_objects_paged_async(
+            "view", None, args.get("page_size", DEFAULT_PAGE_SIZE), args.get("page_id")
+        )
+        return page_json("views", page)
     
     @staticmethod
+    @tool_handler("create DNS view")
     async def _create_view(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Create DNS view."""
-        try:
-            view_data = {
-                "name": args["name"]
-            }
-            
-            if "comment" in args:
-                view_data["comment"] = args["comment"]
-            
-            view_ref = client.create_object("view", view_data)
-            
-            result = {
-                "success": True,
-                "view_reference": view_ref,
-                "name": args["name"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS view: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS view: {str(e)}")
+        view_data = {"name": args["name"], **pick(args, _VIEW_OPTIONAL)}
+        
+        view_ref = await client.create_object_async("view", view_data)
+        
+        return success_json(
+            view_reference=view_ref,
+            name=args["name"]
+        )
     
     @staticmethod
+    @tool_handler("list RPZ zones")
     async def _list_rpz_zones(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """List RPZ zones."""
-        try:
-            params = {}
-            if "view" in args:
-                params["view"] = args["view"]
-            
-            rpz_zones = client.search_objects("zone_rp", params)
-            
-            result = {
-                "rpz_zones": rpz_zones,
-                "count": len(rpz_zones)
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error listing RPZ zones: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to list RPZ zones: {str(e)}")
+        params = pick(args, _RPZ_FILTERS)
+        
+        page = await client.search_objects_paged_async(
+            "zone_rp", params, args.get("page_size", DEFAULT_PAGE_SIZE), args.get("page_id")
+        )
+        return page_json("rpz_zones", page)
     
     @staticmethod
+    @tool_handler("create RPZ zone")
     async def _create_rpz_zone(args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Create RPZ zone."""
-        try:
-            rpz_data = {
-                "fqdn": args["fqdn"]
+        if not _is_fqdn(args["fqdn"]):
+            raise ValidationError(f"Invalid fqdn: {args['fqdn']}")
+        
+        rpz_data = {"fqdn": args["fqdn"], **pick(args, _RPZ_OPTIONAL)}
+        
+        rpz_ref = await client.create_object_async("zone_rp", rpz_data)
+        
+        return success_json(
+            rpz_reference=rpz_ref,
+            fqdn=args["fqdn"]
+        )
+
+
+# Property schemas shared by several tools
+_VIEW_PROPERTY = {
+    "type": "string",
+    "description": "DNS view name (optional, defaults to 'default')"
+}
+_TTL_PROPERTY = {
+    "type": "integer",
+    "description": "Time to live in seconds (optional)"
+}
+_RECORD_COMMENT_PROPERTY = {
+    "type": "string",
+    "description": "Comment for the record (optional)"
+}
+_VERBOSE_PROPERTY = {
+    "type": "boolean",
+    "description": "Include a confirmation message in the response (optional)"
+}
+
+_DNS_TOOL_SPECS = (
+    # Zone Management Tools
+    (
+        "infoblox_dns_delete_zone",
+        "Delete a DNS zone",
+        {
+            "type": "object",
+            "properties": {
+                "zone_ref": {
+                    "type": "string",
+                    "description": "Zone reference (from list_zones) or FQDN"
+                },
+                "verbose": _VERBOSE_PROPERTY
+            },
+            "required": ["zone_ref"]
+        },
+        DNSTools._delete_zone
+    ),
+    
+    (
+        "infoblox_dns_delete_zones",
+        "Delete several DNS zones concurrently",
+        {
+            "type": "object",
+            "properties": {
+                "zone_refs": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Zone references or FQDNs",
+                    "minItems": 1
+                }
+            },
+            "required": ["zone_refs"]
+        },
+        DNSTools._delete_zones
+    ),
+    
+    (
+        "infoblox_dns_get_zone_details",
+        "Get detailed information about a DNS zone",
+        {
+            "type": "object",
+            "properties": {
+                "zone_ref": {
+                    "type": "string",
+                    "description": "Zone reference or FQDN"
+                }
+            },
+            "required": ["zone_ref"]
+        },
+        DNSTools._get_zone_details
+    ),
+    
+    # DNS Record Management - AAAA Records
+    (
+        "infoblox_dns_create_record_aaaa",
+        "Create a DNS AAAA record (IPv6)",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Record name (hostname)"
+                },
+                "ipv6addr": {
+                    "type": "string",
+                    "description": "IPv6 address"
+                },
+                "view": _VIEW_PROPERTY,
+                "ttl": _TTL_PROPERTY,
+                "comment": _RECORD_COMMENT_PROPERTY
+            },
+            "required": ["name", "ipv6addr"]
+        },
+        DNSTools._create_record_aaaa
+    ),
+    
+    # CNAME Records
+    (
+        "infoblox_dns_create_record_cname",
+        "Create a DNS CNAME record",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Record name (alias)"
+                },
+                "canonical": {
+                    "type": "string",
+                    "description": "Canonical name (target)"
+                },
+                "view": _VIEW_PROPERTY,
+                "ttl": _TTL_PROPERTY,
+                "comment": _RECORD_COMMENT_PROPERTY
+            },
+            "required": ["name", "canonical"]
+        },
+        DNSTools._create_record_cname
+    ),
+    
+    # MX Records
+    (
+        "infoblox_dns_create_record_mx",
+        "Create a DNS MX record",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Domain name"
+                },
+                "mail_exchanger": {
+                    "type": "string",
+                    "description": "Mail exchanger hostname"
+                },
+                "preference": {
+                    "type": "integer",
+                    "description": "MX preference value",
+                    "minimum": 0,
+                    "maximum": 65535
+                },
+                "view": _VIEW_PROPERTY,
+                "ttl": _TTL_PROPERTY,
+                "comment": _RECORD_COMMENT_PROPERTY
+            },
+            "required": ["name", "mail_exchanger", "preference"]
+        },
+        DNSTools._create_record_mx
+    ),
+    
+    # PTR Records
+    (
+        "infoblox_dns_create_record_ptr",
+        "Create a DNS PTR record (reverse lookup)",
+        {
+            "type": "object",
+            "properties": {
+                "ipv4addr": {
+                    "type": "string",
+                    "description": "IPv4 address for reverse lookup"
+                },
+                "ptrdname": {
+                    "type": "string",
+                    "description": "Domain name for the PTR record"
+                },
+                "view": _VIEW_PROPERTY,
+                "ttl": _TTL_PROPERTY,
+                "comment": _RECORD_COMMENT_PROPERTY
+            },
+            "required": ["ipv4addr", "ptrdname"]
+        },
+        DNSTools._create_record_ptr
+    ),
+    
+    # SRV Records
+    (
+        "infoblox_dns_create_record_srv",
+        "Create a DNS SRV record",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Service name (e.g., _sip._tcp.example.com)"
+                },
+                "target": {
+                    "type": "string",
+                    "description": "Target hostname"
+                },
+                "port": {
+                    "type": "integer",
+                    "description": "Port number",
+                    "minimum": 0,
+                    "maximum": 65535
+                },
+                "priority": {
+                    "type": "integer",
+                    "description": "Priority value",
+                    "minimum": 0,
+                    "maximum": 65535
+                },
+                "weight": {
+                    "type": "integer",
+                    "description": "Weight value",
+                    "minimum": 0,
+                    "maximum": 65535
+                },
+                "view": _VIEW_PROPERTY,
+                "ttl": _TTL_PROPERTY,
+                "comment": _RECORD_COMMENT_PROPERTY
+            },
+            "required": ["name", "target", "port", "priority", "weight"]
+        },
+        DNSTools._create_record_srv
+    ),
+    
+    # TXT Records
+    (
+        "infoblox_dns_create_record_txt",
+        "Create a DNS TXT record",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Record name"
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Text content"
+                },
+                "view": _VIEW_PROPERTY,
+                "ttl": _TTL_PROPERTY,
+                "comment": _RECORD_COMMENT_PROPERTY
+            },
+            "required": ["name", "text"]
+        },
+        DNSTools._create_record_txt
+    ),
+    
+    # Bulk record creation
+    (
+        "infoblox_dns_bulk_create_records",
+        "Create many DNS records in a single WAPI request",
+        {
+            "type": "object",
+            "properties": {
+                "records": {
+                    "type": "array",
+                    "description": "Records to create",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "type": {
+                                "type": "string",
+                                "enum": list(_RECORD_FIELDS),
+                                "description": "Record type"
+                            },
+                            "data": {
+                                "type": "object",
+                                "description": "Record fields, as for the matching create_record tool (host: name and ipv4addrs, a list of {\"ipv4addr\": ...})",
+                                "additionalProperties": True
+                            }
+                        },
+                        "required": ["type", "data"]
+                    },
+                    "minItems": 1
+                }
+            },
+            "required": ["records"]
+        },
+        DNSTools._bulk_create_records
+    ),
+    
+    # Record Management
+    (
+        "infoblox_dns_update_record",
+        "Update an existing DNS record",
+        {
+            "type": "object",
+            "properties": {
+                "record_ref": {
+                    "type": "string",
+                    "description": "Record reference (from search results)"
+                },
+                "updates": {
+                    "type": "object",
+                    "description": "Fields to update (varies by record type)",
+                    "additionalProperties": True
+                }
+            },
+            "required": ["record_ref", "updates"]
+        },
+        DNSTools._update_record
+    ),
+    
+    (
+        "infoblox_dns_delete_record",
+        "Delete a DNS record",
+        {
+            "type": "object",
+            "properties": {
+                "record_ref": {
+                    "type": "string",
+                    "description": "Record reference (from search results)"
+                },
+                "verbose": _VERBOSE_PROPERTY
+            },
+            "required": ["record_ref"]
+        },
+        DNSTools._delete_record
+    ),
+    
+    # DNS Views
+    (
+        "infoblox_dns_list_views",
+        "List all DNS views",
+        {
+            "type": "object",
+            "properties": {
+                "page_size": PAGE_SIZE_PROPERTY,
+                "page_id": PAGE_ID_PROPERTY
             }
-            
-            if "view" in args:
-                rpz_data["view"] = args["view"]
-            if "comment" in args:
-                rpz_data["comment"] = args["comment"]
-            
-            rpz_ref = client.create_object("zone_rp", rpz_data)
-            
-            result = {
-                "success": True,
-                "rpz_reference": rpz_ref,
-                "fqdn": args["fqdn"]
+        },
+        DNSTools._list_views
+    ),
+    
+    (
+        "infoblox_dns_create_view",
+        "Create a new DNS view",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "View name"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment for the view (optional)"
+                }
+            },
+            "required": ["name"]
+        },
+        DNSTools._create_view
+    ),
+    
+    # Response Policy Zones (RPZ)
+    (
+        "infoblox_dns_list_rpz_zones",
+        "List Response Policy Zones",
+        {
+            "type": "object",
+            "properties": {
+                "view": {
+                    "type": "string",
+                    "description": "DNS view name (optional)"
+                },
+                "page_size": PAGE_SIZE_PROPERTY,
+                "page_id": PAGE_ID_PROPERTY
             }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating RPZ zone: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create RPZ zone: {str(e)}")
-
+        },
+        DNSTools._list_rpz_zones
+    ),
+    
+    (
+        "infoblox_dns_create_rpz_zone",
+        "Create a Response Policy Zone",
+        {
+            "type": "object",
+            "properties": {
+                "fqdn": {
+                    "type": "string",
+                    "description": "RPZ zone FQDN"
+                },
+                "view": _VIEW_PROPERTY,
+                "comment": {
+                    "type": "string",
+                    "description": "Comment for the RPZ zone (optional)"
+                }
+            },
+            "required": ["fqdn"]
+        },
+        DNSTools._create_rpz_zone
+    )
+)
@@ -1,9 +1,14 @@
 """Enhanced error handling and logging for InfoBlox MCP Server."""
 
+import atexit
+import ipaddress
 import logging
-import traceback
-from typing import Dict, Any, Optional
-from functools import wraps
+import logging.handlers
+import queue
+import re
+import socket
+from typing import Dict, Any, Optional, Callable
+from functools import lru_cache, wraps
 
 
 class InfoBloxMCPError(Exception):
@@ -35,6 +40,32 @@ class ValidationError(InfoBloxMCPError):
     pass
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers writes and only flushes on WARNING and above.
+    
+    The buffer is also flushed when the handler is closed, which
+    logging.shutdown() does at exit.
+    """
+    
+    buffer_size = 65536
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                     encoding=self.encoding, errors=getattr(self, "errors", None))
+    
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """Setup logging configuration."""
     
@@ -42,7 +73,14 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     logger = logging.getLogger("infoblox_mcp")
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
-    # Clear existing handlers
+    # Clear existing handlers, stopping the file writer thread of a previous setup
+    listener = getattr(logger, "queue_listener", None)
+    if listener is not None:
+        atexit.unregister(listener.stop)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        logger.queue_listener = None
     logger.handlers.clear()
     
     # Create formatter
@@ -60,12 +98,23 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     # File handler (if specified)
     if log_file:
         try:
-            file_handler = logging.FileHandler(log_file)
+            file_handler = BufferedFileHandler(log_file)
             file_handler.setLevel(logging.DEBUG)  # Always log everything to file
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            
+            # Write to the file from a background thread so logging calls
+            # never block on disk IO
+            log_queue = queue.Queue(-1)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(logging.DEBUG)
+            logger.addHandler(queue_handler)
+            
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            logger.queue_listener = listener
         except Exception as e:
-            logger.warning(f"Could not create log file {log_file}: {str(e)}")
+            logger.warning("Could not create log file %s: %s", log_file, e)
     
     return logger
 
@@ -84,8 +133,8 @@ def handle_exceptions(logger: Optional[logging.Logger] = None):
             except Exception as e:
                 # Log unexpected exceptions
                 if logger:
-                    logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
-                    logger.debug(f"Traceback: {traceback.format_exc()}")
+                    logger.error("Unexpected error in %s: %s", func.__name__, e)
+                    logger.debug("Traceback", exc_info=True)
                 
                 # Convert to our custom exception
                 raise InfoBloxMCPError(
@@ -98,9 +147,61 @@ def handle_exceptions(logger: Optional[logging.Logger] = None):
     return decorator
 
 
+# The validators below are pure, so repeat lookups of the same value are
+# answered from a bounded cache
+_VALIDATION_CACHE_SIZE = 4096
+
+# Dot-separated labels of 1-63 alphanumerics/hyphens that neither start
+# nor end with a hyphen, with an optional trailing dot
+_HOSTNAME_RE = re.compile(
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?'
+    r'(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*\.?'
+)
+
+# Common MAC address formats: XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX,
+# XXXX.XXXX.XXXX and XXXXXXXXXXXX
+_MAC_RE = re.compile(
+    r'(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}'
+    r'|(?:[0-9A-Fa-f]{4}\.){2}[0-9A-Fa-f]{4}'
+    r'|[0-9A-Fa-f]{12}'
+)
+
+
 def validate_ip_address(ip_str: str) -> bool:
     """Validate IP address format."""
-    import ipaddress
+    return isinstance(ip_str, str) and _validate_ip_address(ip_str)
+
+
+def validate_network_cidr(network_str: str) -> bool:
+    """Validate network CIDR format."""
+    return isinstance(network_str, str) and _validate_network_cidr(network_str)
+
+
+def validate_hostname(hostname: str) -> bool:
+    """Validate hostname format."""
+    return isinstance(hostname, str) and _validate_hostname(hostname)
+
+
+def validate_mac_address(mac_str: str) -> bool:
+    """Validate MAC address format."""
+    return isinstance(mac_str, str) and _validate_mac_address(mac_str)
+
+
+# The public validators reject non-str input themselves, so the cached
+# implementations below only ever see hashable strings
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_ip_address(ip_str: str) -> bool:
+    # inet_pton validates without building an address object; ipaddress
+    # still handles scoped IPv6 addresses
+    if '%' not in ip_str:
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, ip_str)
+                return True
+            except (OSError, ValueError):
+                pass
+        return False
     try:
         ipaddress.ip_address(ip_str)
         return True
@@ -108,9 +209,8 @@ def validate_ip_address(ip_str: str) -> bool:
         return False
 
 
-def validate_network_cidr(network_str: str) -> bool:
-    """Validate network CIDR format."""
-    import ipaddress
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_network_cidr(network_str: str) -> bool:
     if '/' not in network_str:
         return False
     try:
@@ -120,40 +220,71 @@ def validate_network_cidr(network_str: str) -> bool:
         return False
 
 
-def validate_hostname(hostname: str) -> bool:
-    """Validate hostname format."""
-    import re
-    
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_hostname(hostname: str) -> bool:
     if not hostname or len(hostname) > 253:
         return False
+    return _HOSTNAME_RE.fullmatch(hostname) is not None
+
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_mac_address(mac_str: str) -> bool:
+    return _MAC_RE.fullmatch(mac_str) is not None
+
+
+# JSON schema primitive types -> Python types accepted for them
+_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+
+def compile_schema_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], None]:
+    """Compile a tool's input schema into a fast argument check.
     
-    # Remove trailing dot if present
-    if hostname.endswith('.'):
-        hostname = hostname[:-1]
+    Covers required properties, primitive types, enums and integer bounds,
+    which is what the tool schemas use. The returned callable raises
+    ValidationError on the first problem found.
+    """
+    required = tuple(schema.get("required", ()))
+    checks = []
+    for name, prop in schema.get("properties", {}).items():
+        expected = _SCHEMA_TYPES.get(prop.get("type"))
+        enum = tuple(prop["enum"]) if "enum" in prop else None
+        if expected is not None or enum is not None:
+            checks.append((name, prop.get("type"), expected, enum, prop.get("minimum"), prop.get("maximum")))
+    checks = tuple(checks)
     
-    # Check each label
-    labels = hostname.split('.')
-    for label in labels:
-        if not label or len(label) > 63:
-            return False
-        if not re.match(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?$', label):
-            return False
+    def validate(arguments: Dict[str, Any]) -> None:
+        missing = [name for name in required if name not in arguments]
+        if missing:
+            raise ValidationError(f"Missing required argument(s): {', '.join(missing)}")
+        
+        for name, type_name, expected, enum, minimum, maximum in checks:
+            if name not in arguments:
+                continue
+            value = arguments[name]
+            if expected is not None:
+                # bool is an int subclass but not a JSON integer/number
+                if not isinstance(value, expected) or (isinstance(value, bool) and type_name != "boolean"):
+                    raise ValidationError(f"Argument '{name}' must be of type {type_name}")
+            if enum is not None and value not in enum:
+                raise ValidationError(f"Argument '{name}' must be one of: {', '.join(map(str, enum))}")
+            if minimum is not None and value < minimum:
+                raise ValidationError(f"Argument '{name}' must be >= {minimum}")
+            if maximum is not None and value > maximum:
+                raise ValidationError(f"Argument '{name}' must be <= {maximum}")
     
-    return True
+    return validate
 
 
-def validate_mac_address(mac_str: str) -> bool:
-    """Validate MAC address format."""
-    import re
-    
-    # Common MAC address formats
-    patterns = [
-        r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$',  # XX:XX:XX:XX:XX:XX or XX-XX-XX-XX-XX-XX
-        r'^([0-9A-Fa-f]{4}\.){2}([0-9A-Fa-f]{4})$',    # XXXX.XXXX.XXXX
-        r'^([0-9A-Fa-f]{12})$'                          # XXXXXXXXXXXX
-    ]
-    
-    return any(re.match(pattern, mac_str) for pattern in patterns)
+# C0 control characters stripped by sanitize_input; tab, newline and
+# carriage return are kept
+_CONTROL_TRANSLATE = {i: None for i in range(32) if chr(i) not in '\t\n\r'}
 
 
 def sanitize_input(value: str, max_length: int = 255) -> str:
@@ -162,7 +293,7 @@ def sanitize_input(value: str, max_length: int = 255) -> str:
         value = str(value)
     
     # Remove control characters
-    value = ''.join(char for char in value if ord(char) >= 32 or char in '\t\n\r')
+    value = value.translate(_CONTROL_TRANSLATE)
     
     # Truncate if too long
     if len(value) > max_length:
@@ -171,6 +302,16 @@ def sanitize_input(value: str, max_length: int = 255) -> str:
     return value.strip()
 
 
+# User-facing messages for common InfoBlox API HTTP status codes
+_HTTP_ERROR_MESSAGES = {
+    401: "Authentication failed. Please check your credentials.",
+    403: "Access denied. You don't have permission for this operation.",
+    404: "The requested resource was not found.",
+    409: "The operation conflicts with existing data.",
+    500: "InfoBlox server error. Please try again later."
+}
+
+
 class ErrorHandler:
     """Centralized error handling for the MCP server."""
     
@@ -182,30 +323,20 @@ class ErrorHandler:
         from .client import InfoBloxAPIError
         
         if isinstance(error, InfoBloxAPIError):
-            self.logger.error(f"InfoBlox API error{' in ' + context if context else ''}: {str(error)}")
+            self.logger.error("InfoBlox API error%s: %s", f" in {context}" if context else "", error)
             
             # Map common errors to user-friendly messages
-            if error.status_code == 401:
-                return "Authentication failed. Please check your credentials."
-            elif error.status_code == 403:
-                return "Access denied. You don't have permission for this operation."
-            elif error.status_code == 404:
-                return "The requested resource was not found."
-            elif error.status_code == 409:
-                return "The operation conflicts with existing data."
-            elif error.status_code == 500:
-                return "InfoBlox server error. Please try again later."
-            else:
-                return f"InfoBlox API error: {str(error)}"
+            message = _HTTP_ERROR_MESSAGES.get(error.status_code)
+            return message or f"InfoBlox API error: {error}"
         
         else:
-            self.logger.error(f"Unexpected error{' in ' + context if context else ''}: {str(error)}")
-            return f"An unexpected error occurred: {str(error)}"
+            self.logger.error("Unexpected error%s: %s", f" in {context}" if context else "", error)
+            return f"An unexpected error occurred: {error}"
     
     def handle_validation_error(self, field: str, value: str, expected: str) -> str:
         """Handle validation errors."""
         message = f"Invalid {field}: '{value}'. Expected {expected}."
-        self.logger.warning(f"Validation error: {message}")
+        self.logger.warning("Validation error: %s", message)
         return message
     
     def handle_configuration_error(self, error: Exception) -> str:
@@ -0,0 +1,70 @@
+"""JSON serialization helpers for InfoBlox MCP Server tool responses."""
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+# Tool responses are compact by default; set INFOBLOX_MCP_PRETTY_JSON=1 to
+# indent them when debugging
+PRETTY_JSON = os.environ.get("INFOBLOX_MCP_PRETTY_JSON") == "1"
+
+
+def to_json(obj: Any, pretty: Optional[bool] = None) -> str:
+    """Serialize a tool response to a JSON string.
+    
+    pretty overrides the INFOBLOX_MCP_PRETTY_JSON default for one call.
+    """
+    if pretty is None:
+        pretty = PRETTY_JSON
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def compile_envelope(constants: Dict[str, Any], keys: Tuple[str, ...]) -> Callable[..., str]:
+    """Build a serializer for a response object with a fixed shape.
+    
+    The object is the constants followed by keys, in that order. The
+    constant members and the key names are serialized once here; a call
+    passes the values for keys positionally and only those are
+    serialized. Pretty output goes through to_json unchanged.
+    """
+    head = to_json(constants, pretty=False)[:-1]
+    separator = "," if constants else ""
+    prefixes = []
+    for key in keys:
+        prefixes.append(separator + to_json(key, pretty=False) + ":")
+        separator = ","
+    
+    def envelope(*values: Any) -> str:
+        if PRETTY_JSON:
+            obj = dict(constants)
+            obj.update(zip(keys, values))
+            return to_json(obj)
+        parts = [head]
+        for prefix, value in zip(prefixes, values):
+            parts.append(prefix)
+            parts.append(to_json(value, pretty=False))
+        parts.append("}")
+        return "".join(parts)
+    
+    return envelope
+
+
+def from_json(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from a string or raw bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,14 +1,25 @@
 
-import json
+import asyncio
+import functools
 import logging
 import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from .config import InfoBloxConfig
+from .json_utils import from_json, to_json
 from mcp.types import Tool
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful InfoBlox Network Assistant. You help users manage DNS, DHCP, and IPAM. Use the provided tools to answer user questions. dealing with IPs, networks, zones, and Splunk logs. If the user asks for historical data or 'who did what', use the splunk/history tools."
+}
+
+# Closes the user message, the messages array and the request object
+_PAYLOAD_SUFFIX = b'}]}'
+
+
 class LLMClient:
     """Client for interacting with LLM APIs (OpenAI Compatible)."""
     
@@ -19,6 +30,19 @@ class LLMClient:
         self.model = config.llm_model or "gpt-4o"
         self.base_url = config.llm_base_url or "https://api.openai.com/v1"
         
+        self._endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        
+        # Reuse connections (and TLS sessions) across LLM calls
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        
+        # Encoded request body prefix, rebuilt only when the tool names change
+        self._payload_cache: Optional[Tuple[Tuple[str, ...], bytes]] = None
+        
         if not self.base_url.rstrip('/').endswith('/v1'):
              # normalizing base url if needed, though strictly v1 might not be required for some local servers
              pass
@@ -27,50 +51,57 @@ class LLMClient:
         """Check if LLM is configured."""
         return bool(self.api_key)
 
-    def generate_response(self, user_message: str, mcp_tools: List[Tool]) -> Dict[str, Any]:
-        """
-        Send message to LLM and get response (Text or Tool Call).
-        """
-        if not self.is_configured():
-            return {"type": "error", "content": "LLM not configured."}
+    def close(self):
+        """Close the HTTP session."""
+        self._session.close()
 
-        endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
+    def _get_payload_prefix(self, mcp_tools: List[Tool]) -> bytes:
+        """Return the encoded request body up to the user message content.
+        
+        Model, tools and system prompt only change with the tool list, so
+        they are serialized once and each call only encodes the user message.
+        """
+        key = tuple(tool.name for tool in mcp_tools)
+        cached = self._payload_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
         # Convert MCP Tools to OpenAI Tools format
-        openai_tools = []
-        for tool in mcp_tools:
-            openai_tools.append({
+        openai_tools = [
+            {
                 "type": "function",
                 "function": {
                     "name": tool.name,
                     "description": tool.description,
                     "parameters": tool.inputSchema
                 }
-            })
+            }
+            for tool in mcp_tools
+        ]
+        static = to_json({"model": self.model, "tools": openai_tools, "tool_choice": "auto"})
+        prefix = (
+            static.rstrip()[:-1]
+            + ',"messages":['
+            + to_json(SYSTEM_MESSAGE)
+            + ',{"role":"user","content":'
+        ).encode()
+        self._payload_cache = (key, prefix)
+        return prefix
+
+    def generate_response(self, user_message: str, mcp_tools: List[Tool]) -> Dict[str, Any]:
+        """
+        Send message to LLM and get response (Text or Tool Call).
+        """
+        if not self.is_configured():
+            return {"type": "error", "content": "LLM not configured."}
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "system", 
-                    "content": "You are a helpful InfoBlox Network Assistant. You help users manage DNS, DHCP, and IPAM. Use the provided tools to answer user questions. dealing with IPs, networks, zones, and Splunk logs. If the user asks for historical data or 'who did what', use the splunk/history tools."
-                },
-                {"role": "user", "content": user_message}
-            ],
-            "tools": openai_tools,
-            "tool_choice": "auto"
-        }
-        
         try:
-            logger.info(f"Calling LLM: {self.model} with message: {user_message[:50]}...")
-            response = requests.post(endpoint, json=payload, headers=headers, timeout=30)
+            logger.info("Calling LLM: %s with message: %.50s...", self.model, user_message)
+            body = self._get_payload_prefix(mcp_tools) + to_json(user_message).encode() + _PAYLOAD_SUFFIX
+            response = self._session.post(self._endpoint, data=body, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = from_json(response.content)
             choice = data['choices'][0]
             message = choice['message']
             
@@ -80,7 +111,7 @@ class LLMClient:
                 return {
                     "type": "tool_call",
                     "tool_name": function["name"],
-                    "tool_args": json.loads(function["arguments"])
+                    "tool_args": from_json(function["arguments"])
                 }
             else:
                 return {
@@ -89,5 +120,12 @@ class LLMClient:
                 }
                 
         except Exception as e:
-            logger.error(f"LLM Call Failed: {e}")
+            logger.error("LLM Call Failed: %s", e)
             return {"type": "error", "content": f"LLM error: {str(e)}"}
+
+    async def generate_response_async(self, user_message: str, mcp_tools: List[Tool]) -> Dict[str, Any]:
+        """Async variant of generate_response that keeps the event loop free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate_response, user_message, mcp_tools)
+        )
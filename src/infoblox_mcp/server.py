@@ -2,8 +2,8 @@
 
 import asyncio
 import logging
-import json
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -22,10 +22,15 @@ import mcp.types as types
 from .config import ConfigManager, InfoBloxConfig
 from .client import InfoBloxClient, InfoBloxAPIError
 from .tools import ToolRegistry
+from .json_utils import to_json
+from .splunk_tools import reset_splunk_clients
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds a status resource read is reused before the connection is re-tested
+STATUS_CACHE_TTL = 5.0
+
 
 class InfoBloxMCPServer:
     """InfoBlox MCP Server implementation."""
@@ -37,6 +42,9 @@ class InfoBloxMCPServer:
         self.client: Optional[InfoBloxClient] = None
         self.tool_registry = ToolRegistry()
         self.server = Server("infoblox-mcp-server")
+        # Serialized resources, keyed on the config (and client) they describe
+        self._config_json_cache: Optional[Tuple[Optional[InfoBloxConfig], str]] = None
+        self._status_json_cache: Optional[Tuple[Optional[InfoBloxConfig], Optional[InfoBloxClient], float, str]] = None
         self._setup_handlers()
     
     def _setup_handlers(self):
@@ -64,32 +72,10 @@ class InfoBloxMCPServer:
         async def handle_read_resource(uri: str) -> str:
             """Read a specific resource."""
             if uri == "infoblox://config":
-                if self.config:
-                    config_data = self.config.dict()
-                    # Don't expose password
-                    config_data.pop('password', None)
-                    return json.dumps(config_data, indent=2)
-                return json.dumps({"error": "No configuration loaded"})
+                return self._read_config_resource()
             
             elif uri == "infoblox://status":
-                status = {
-                    "configured": self.config is not None,
-                    "connected": False,
-                    "grid_master": None,
-                    "wapi_version": None
-                }
-                
-                if self.config:
-                    status["grid_master"] = self.config.grid_master_ip
-                    status["wapi_version"] = self.config.wapi_version
-                    
-                    if self.client:
-                        try:
-                            status["connected"] = self.client.test_connection()
-                        except Exception as e:
-                            status["connection_error"] = str(e)
-                
-                return json.dumps(status, indent=2)
+                return self._read_status_resource()
             
             else:
                 raise ValueError(f"Unknown resource URI: {uri}")
@@ -125,6 +111,51 @@ class InfoBloxMCPServer:
                 logger.error(error_msg)
                 return [types.TextContent(type="text", text=error_msg)]
     
+    def _read_config_resource(self) -> str:
+        """Serialize the config resource, reusing the result until the config changes."""
+        cached = self._config_json_cache
+        if cached is not None and cached[0] is self.config:
+            return cached[1]
+        
+        if self.config:
+            config_data = self.config.model_dump(mode='json')
+            # Don't expose password
+            config_data.pop('password', None)
+            text = to_json(config_data)
+        else:
+            text = to_json({"error": "No configuration loaded"})
+        self._config_json_cache = (self.config, text)
+        return text
+    
+    def _read_status_resource(self) -> str:
+        """Serialize the status resource, re-checking the connection at most every STATUS_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._status_json_cache
+        if (cached is not None and cached[0] is self.config and cached[1] is self.client
+                and now - cached[2] < STATUS_CACHE_TTL):
+            return cached[3]
+        
+        status = {
+            "configured": self.config is not None,
+            "connected": False,
+            "grid_master": None,
+            "wapi_version": None
+        }
+        
+        if self.config:
+            status["grid_master"] = self.config.grid_master_ip
+            status["wapi_version"] = self.config.wapi_version
+            
+            if self.client:
+                try:
+                    status["connected"] = self.client.test_connection()
+                except Exception as e:
+                    status["connection_error"] = str(e)
+        
+        text = to_json(status)
+        self._status_json_cache = (self.config, self.client, now, text)
+        return text
+    
     async def _ensure_client(self):
         """Ensure InfoBlox client is initialized."""
         if self.config is None:
@@ -135,7 +166,7 @@ class InfoBloxMCPServer:
                 self.client = InfoBloxClient(self.config)
                 logger.info("InfoBlox client initialized successfully")
             except Exception as e:
-                logger.error(f"Failed to initialize InfoBlox client: {str(e)}")
+                logger.error("Failed to initialize InfoBlox client: %s", e)
                 raise InfoBloxAPIError(f"Failed to connect to InfoBlox: {str(e)}")
     
     async def run(self):
@@ -169,12 +200,13 @@ class InfoBloxMCPServer:
         except KeyboardInterrupt:
             logger.info("Server interrupted by user")
         except Exception as e:
-            logger.error(f"Server error: {str(e)}")
+            logger.error("Server error: %s", e)
             raise
         finally:
             if self.client:
-                self.client.logout()
+                self.client.close()
                 logger.info("InfoBlox client disconnected")
+            reset_splunk_clients()
 
 
 def main():
@@ -191,6 +223,14 @@ def main():
             else:
                 print("Failed to reset configuration")
             return
+        elif sys.argv[1] == "--export-config":
+            config_manager = ConfigManager()
+            exported = config_manager.export_config()
+            if exported is None:
+                print("No configuration found. Run without arguments to configure.")
+            else:
+                print(exported)
+            return
         elif sys.argv[1] == "--test-connection":
             config_manager = ConfigManager()
             config = config_manager.load_config()
@@ -212,6 +252,7 @@ def main():
             print("Usage:")
             print("  infoblox-mcp-server              Run the MCP server")
             print("  infoblox-mcp-server --reset-config    Reset configuration")
+            print("  infoblox-mcp-server --export-config   Print configuration (without secrets)")
             print("  infoblox-mcp-server --test-connection Test InfoBlox connection")
             print("  infoblox-mcp-server --help            Show this help")
             return
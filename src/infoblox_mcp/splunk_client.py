@@ -1,15 +1,49 @@
 
-import json
+import itertools
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 import requests
 from urllib.parse import urljoin
 
 from .config import InfoBloxConfig
+from .json_utils import from_json
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Bytes read from the export stream per chunk
+STREAM_CHUNK_SIZE = 65536
+
+
+def _iter_raw_lines(response: requests.Response) -> Iterator[bytes]:
+    """Yield non-empty newline-delimited lines from a streamed response as bytes.
+    
+    Lines are never decoded: from_json parses bytes directly. Pieces of a
+    line that spans chunks are collected and joined once, when its end
+    arrives.
+    """
+    pending: List[bytes] = []
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        head, sep, tail = chunk.rpartition(b"\n")
+        if not sep:
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(head)
+            head = b"".join(pending)
+            pending = []
+        for line in head.split(b"\n"):
+            if line and not line.isspace():
+                yield line
+        if tail:
+            pending.append(tail)
+    rest = b"".join(pending)
+    if rest and not rest.isspace():
+        yield rest
+
+
 class SplunkClient:
     """Client for interacting with Splunk REST API."""
     
@@ -36,6 +70,28 @@ class SplunkClient:
         else:
             raise ValueError("Splunk credentials not configured. Please check config.")
 
+    def close(self):
+        """Close the HTTP session."""
+        self.session.close()
+
+    def _iter_results(self, response: requests.Response) -> Iterator[Dict[str, Any]]:
+        """Yield result rows from a streamed export response."""
+        # The export endpoint returns a stream of JSON objects, not a single JSON list.
+        # We need to parse line by line.
+        for line in _iter_raw_lines(response):
+            try:
+                data = from_json(line)
+            except ValueError:
+                continue
+            if type(data) is not dict:
+                continue
+            # Export endpoint sometimes returns metadata/progress, we just want results
+            result = data.get("result", _MISSING)
+            if result is not _MISSING:
+                yield result
+            elif "pk" not in data: # Try direct dict if flattened
+                yield data
+
     def search(self, query: str, earliest_time: str = "-30d", latest_time: str = "now", count: int = 100) -> List[Dict[str, Any]]:
         """
         Execute a Splunk search and return results.
@@ -56,33 +112,19 @@ class SplunkClient:
         }
         
         try:
-            logger.info(f"Executing Splunk search: {query}")
-            response = self.session.post(endpoint, data=params, timeout=60) # 60s timeout for search
-            response.raise_for_status()
+            logger.info("Executing Splunk search: %s", query)
+            response = self.session.post(endpoint, data=params, timeout=60, stream=True) # 60s timeout for search
             
-            # The export endpoint returns a stream of JSON objects, not a single JSON list.
-            # We need to parse line by line.
-            results = []
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        data = json.loads(line)
-                        # Export endpoint sometimes returns metadata/progress, we just want results
-                        if "result" in data:
-                            results.append(data["result"])
-                        elif isinstance(data, dict) and not "pk" in data: # Try direct dict if flattened
-                            results.append(data)
-                            
-                        if len(results) >= count:
-                            break
-                    except json.JSONDecodeError:
-                        continue
-                        
-            return results
+            # Entered before raise_for_status so error responses release
+            # their pooled connection too
+            with response:
+                if not response.ok:
+                    # Read the error body while the stream is still open
+                    logger.error("Splunk response: %s", response.text)
+                response.raise_for_status()
+                return list(itertools.islice(self._iter_results(response), count))
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Splunk search failed: {str(e)}")
-            if e.response is not None:
-                logger.error(f"Splunk response: {e.response.text}")
+            logger.error("Splunk search failed: %s", e)
             raise Exception(f"Splunk search failed: {str(e)}")
 
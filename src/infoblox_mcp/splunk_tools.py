@@ -1,14 +1,39 @@
 
-import json
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from .client import InfoBloxClient
 from .config import InfoBloxConfig
 from .splunk_client import SplunkClient
+from .json_utils import to_json
 
 logger = logging.getLogger(__name__)
 
+# SplunkClient per InfoBlox config, so audit searches reuse one session.
+# The config is kept alongside to guard against id() reuse.
+_SPLUNK_CACHE: Dict[int, Tuple[InfoBloxConfig, SplunkClient]] = {}
+
+
+def get_splunk_client(config: InfoBloxConfig) -> SplunkClient:
+    """Return the shared SplunkClient for a config, creating it on first use."""
+    cached = _SPLUNK_CACHE.get(id(config))
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    
+    splunk_client = SplunkClient(config)
+    _SPLUNK_CACHE[id(config)] = (config, splunk_client)
+    return splunk_client
+
+
+def reset_splunk_clients():
+    """Close and forget cached Splunk clients, e.g. after a config reload."""
+    for _, splunk_client in _SPLUNK_CACHE.values():
+        splunk_client.close()
+    _SPLUNK_CACHE.clear()
+
+
 class SplunkTools:
     """Tools for interacting with Splunk."""
 
@@ -33,6 +58,10 @@ class SplunkTools:
                     "days_back": {
                         "type": "integer",
                         "description": "Number of days to search back (default: 30)"
+                    },
+                    "pretty": {
+                        "type": "boolean",
+                        "description": "Indent the JSON response for readability (default: false)"
                     }
                 },
                 "required": ["object_name"]
@@ -52,9 +81,8 @@ class SplunkTools:
             action = args.get("action")
             days_back = args.get("days_back", 30)
             
-            # Init Splunk Client
             # client.config should be available
-            splunk_client = SplunkClient(client.config)
+            splunk_client = get_splunk_client(client.config)
             
             # Construct Query
             # Assuming standard InfoBlox Splunk Add-on sourcetype "infoblox:audit"
@@ -67,12 +95,15 @@ class SplunkTools:
             query += " | table _time, admin_name, action, object_type, object_name, _raw"
             query += " | sort -_time"
             
-            logger.info(f"Running Splunk query for {object_name}")
-            results = splunk_client.search(
+            logger.info("Running Splunk query for %s", object_name)
+            # The search blocks for up to 60s, so run it off the event loop
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(None, functools.partial(
+                splunk_client.search,
                 query, 
                 earliest_time=f"-{days_back}d", 
                 latest_time="now"
-            )
+            ))
             
             response = {
                 "object_name": object_name,
@@ -81,7 +112,7 @@ class SplunkTools:
                 "events": results
             }
             
-            return json.dumps(response, indent=2)
+            return to_json(response, pretty=args.get("pretty"))
 
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return to_json({"error": str(e)})
@@ -0,0 +1,64 @@
+"""Helpers shared by the InfoBlox MCP tool implementations."""
+
+import functools
+import logging
+from typing import Any, Callable, Dict
+from .client import InfoBloxAPIError
+from .error_handling import InfoBloxMCPError
+from .json_utils import to_json
+
+
+logger = logging.getLogger(__name__)
+
+# Schemas for the page_size/page_id arguments of the paged list tools
+PAGE_SIZE_PROPERTY = {
+    "type": "integer",
+    "description": "Maximum number of results to return (optional, defaults to 1000)",
+    "minimum": 1
+}
+PAGE_ID_PROPERTY = {
+    "type": "string",
+    "description": "next_page_id from a previous call to fetch the following page (optional)"
+}
+
+
+def pick(args: Dict[str, Any], keys: tuple) -> Dict[str, Any]:
+    """Copy the given keys from the tool arguments, skipping absent ones."""
+    return {key: args[key] for key in keys if key in args}
+
+
+def success_json(**fields: Any) -> str:
+    """Serialize a successful mutation response."""
+    return to_json({"success": True, **fields})
+
+
+def page_json(key: str, page: Dict[str, Any]) -> str:
+    """Serialize one page of search results in the list tools' response shape."""
+    items = page["result"]
+    return to_json({key: items, "count": len(items), "next_page_id": page["next_page_id"]})
+
+
+def tool_handler(label: str) -> Callable:
+    """Serialize a tool handler's result and report unexpected failures as InfoBloxAPIError("Failed to <label>: ...").
+
+    InfoBloxAPIError (with its status_code) and the server's own errors,
+    such as ValidationError, propagate unchanged. The handler may return a
+    dict, serialized with to_json, or JSON text as a str. Works for both
+    static handlers (args, client) and methods (self, args, client).
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any) -> str:
+            try:
+                result = await fn(*args)
+                if isinstance(result, str):
+                    return result
+                return to_json(result)
+            except (InfoBloxAPIError, InfoBloxMCPError):
+                raise
+            except Exception as e:
+                logger.error("Failed to %s: %s", label, e)
+                logger.debug("Traceback", exc_info=True)
+                raise InfoBloxAPIError(f"Failed to {label}: {e}") from e
+        return wrapper
+    return decorator
@@ -1,26 +1,113 @@
 """Tool registry and implementations for InfoBlox MCP Server."""
 
-import json
 import logging
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Callable, Awaitable
 from mcp.types import Tool
 from .client import InfoBloxClient, InfoBloxAPIError
-from .dns_tools import DNSTools
-from .dhcp_tools import DHCPTools
-from .additional_tools import IPAMTools, GridTools, BulkTools, SearchTools
-from .splunk_tools import SplunkTools
-from .aws_import_tools import AWSImportTools
+from .config import env_number
+from .error_handling import compile_schema_validator
+from .json_utils import compile_envelope
+from .tool_utils import pick, tool_handler
 
 
 logger = logging.getLogger(__name__)
 
+# Read-only listing tools whose responses are reused for identical arguments
+_READ_ONLY_TOOLS = frozenset({
+    "infoblox_dns_list_zones",
+    "infoblox_dhcp_list_networks",
+    "infoblox_grid_list_members",
+    "infoblox_ipam_get_network_utilization"
+})
+
+# Read-only tools that always query the grid: their responses are never
+# cached, and running them doesn't drop the cached listings
+_LIVE_READ_TOOLS = frozenset({
+    "infoblox_grid_get_status"
+})
+
+# Seconds a cached read-only response stays valid; INFOBLOX_TOOL_CACHE_TTL=0 disables it
+TOOL_CACHE_TTL = env_number("INFOBLOX_TOOL_CACHE_TTL", 30.0, minimum=0, cast=float)
+TOOL_CACHE_MAX_SIZE = 1024
+
+# Unknown tool names remembered so repeated calls are rejected without
+# logging each one again
+UNKNOWN_TOOL_TTL = 60.0
+UNKNOWN_TOOL_MAX_SIZE = 256
+
+# Search template per DNS record type for infoblox_dns_search_records:
+# (WAPI object type, (argument key, WAPI search field) pairs). ip_address
+# only filters A/AAAA records, on their address field.
+_RECORD_FILTER_FIELDS = (("name", "name"), ("view", "view"), ("zone", "zone"))
+_RECORD_SEARCH = {
+    "A": ("record:a", _RECORD_FILTER_FIELDS + (("ip_address", "ipv4addr"),)),
+    "AAAA": ("record:aaaa", _RECORD_FILTER_FIELDS + (("ip_address", "ipv6addr"),)),
+    "CNAME": ("record:cname", _RECORD_FILTER_FIELDS),
+    "MX": ("record:mx", _RECORD_FILTER_FIELDS),
+    "PTR": ("record:ptr", _RECORD_FILTER_FIELDS),
+    "SRV": ("record:srv", _RECORD_FILTER_FIELDS),
+    "TXT": ("record:txt", _RECORD_FILTER_FIELDS)
+}
+
+# Argument keys copied into WAPI search filters / object data, when present
+_ZONE_FILTERS = ("view", "zone_format")
+_ZONE_KEYS = ("fqdn", "view", "zone_format", "comment")
+_RECORD_A_KEYS = ("name", "ipv4addr", "view", "ttl", "comment")
+_NETWORK_FILTERS = ("network_view", "network_container")
+_NETWORK_KEYS = ("network", "network_view", "comment")
+
+# Responses of the high-volume create/allocate tools, serialized from
+# pre-rendered templates
+_ZONE_CREATED = compile_envelope({"success": True}, ("zone_reference", "fqdn"))
+_RECORD_A_CREATED = compile_envelope({"success": True}, ("record_reference", "name", "ipv4addr"))
+_NETWORK_CREATED = compile_envelope({"success": True}, ("network_reference", "network"))
+_NEXT_AVAILABLE_IPS = compile_envelope({}, ("network", "available_ips", "count"))
+
+# Tool handlers take the call arguments and the InfoBlox client and return JSON text
+ToolHandler = Callable[[Dict[str, Any], InfoBloxClient], Awaitable[str]]
+
+
+class ToolEntry(NamedTuple):
+    """A registered tool."""
+    description: str
+    parameters: Dict[str, Any]
+    handler: ToolHandler
+    validator: Callable[[Dict[str, Any]], None]
+
+
+def _with_validator(
+    handler: ToolHandler,
+    validator: Callable[[Dict[str, Any]], None]
+) -> ToolHandler:
+    """Wrap a tool handler so its arguments are validated before it runs."""
+    async def validated(arguments: Dict[str, Any], client: InfoBloxClient) -> str:
+        validator(arguments)
+        return await handler(arguments, client)
+    return validated
+
 
 class ToolRegistry:
     """Registry for InfoBlox MCP tools."""
     
     def __init__(self):
         """Initialize tool registry."""
-        self.tools: Dict[str, Dict[str, Any]] = {}
+        self.tools: Dict[str, ToolEntry] = {}
+        # Tool name -> coroutine function run by execute_tool
+        self._handlers: Dict[str, ToolHandler] = {}
+        # (tool name, arguments) -> (expiry, response) for read-only tools
+        self._response_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        # Bumped when any other tool starts or finishes; a read only caches
+        # its response if no such call overlapped it
+        self._cache_generation = 0
+        # Client the cached responses came from; they are dropped when a
+        # call arrives with a different one (e.g. rebuilt after a config change)
+        self._cache_client: Optional[InfoBloxClient] = None
+        # MCP Tool objects, built on first request after a registration
+        self._tools_cache: Optional[List[Tool]] = None
+        # Unknown tool name -> expiry of its negative cache entry
+        self._unknown_tools: "OrderedDict[str, float]" = OrderedDict()
         self._register_all_tools()
     
     def register_tool(
@@ -28,43 +115,114 @@ class ToolRegistry:
         name: str,
         description: str,
         parameters: Dict[str, Any],
-        handler: Callable[[Dict[str, Any], InfoBloxClient], Awaitable[str]]
+        handler: ToolHandler,
+        validator: Optional[Callable[[Dict[str, Any]], None]] = None
     ):
-        """Register a tool."""
-        self.tools[name] = {
-            "description": description,
-            "parameters": parameters,
-            "handler": handler
-        }
+        """Register a tool.
+        
+        Arguments are checked against the parameters schema before the
+        handler runs; the check is compiled here unless one is passed in.
+        """
+        if validator is None:
+            validator = compile_schema_validator(parameters)
+        self.tools[name] = ToolEntry(description, parameters, handler, validator)
+        self._handlers[name] = _with_validator(handler, validator)
+        self._unknown_tools.pop(name, None)
+        self._invalidate()
+    
+    def _invalidate(self):
+        """Drop cached views of the registry after it changes."""
+        self._tools_cache = None
+        self._invalidate_responses()
+    
+    def _invalidate_responses(self):
+        """Drop cached read-only responses, including reads still in flight."""
+        self._cache_generation += 1
+        self._response_cache.clear()
     
     def get_all_tools(self) -> List[Tool]:
         """Get all registered tools as MCP Tool objects."""
-        tools = []
-        for name, tool_info in self.tools.items():
-            tools.append(Tool(
-                name=name,
-                description=tool_info["description"],
-                inputSchema=tool_info["parameters"]
-            ))
-        return tools
+        if self._tools_cache is None:
+            self._tools_cache = [
+                Tool(
+                    name=name,
+                    description=entry.description,
+                    inputSchema=entry.parameters
+                )
+                for name, entry in self.tools.items()
+            ]
+        return list(self._tools_cache)
     
     async def execute_tool(self, name: str, arguments: Dict[str, Any], client: InfoBloxClient) -> str:
         """Execute a tool by name."""
-        if name not in self.tools:
-            raise ValueError(f"Unknown tool: {name}")
+        handler = self._handlers.get(name)
+        if handler is None:
+            self._reject_unknown_tool(name)
         
-        handler = self.tools[name]["handler"]
-        return await handler(arguments, client)
+        if name in _LIVE_READ_TOOLS:
+            return await handler(arguments, client)
+        
+        if name not in _READ_ONLY_TOOLS or TOOL_CACHE_TTL <= 0:
+            # Any other tool may change what the listings return
+            self._invalidate_responses()
+            try:
+                return await handler(arguments, client)
+            finally:
+                self._invalidate_responses()
+        
+        if client is not self._cache_client:
+            self._invalidate_responses()
+            self._cache_client = client
+        
+        try:
+            key = (name, frozenset(arguments.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable argument values; don't cache
+            return await handler(arguments, client)
+        
+        cached = self._response_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._response_cache.move_to_end(key)
+            return cached[1]
+        
+        generation = self._cache_generation
+        response = await handler(arguments, client)
+        if generation != self._cache_generation:
+            # A write ran while this read was in flight; its result may be stale
+            return response
+        self._response_cache[key] = (time.monotonic() + TOOL_CACHE_TTL, response)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > TOOL_CACHE_MAX_SIZE:
+            self._response_cache.popitem(last=False)
+        return response
+    
+    def _reject_unknown_tool(self, name: str):
+        """Raise for an unknown tool name, logging it once per UNKNOWN_TOOL_TTL."""
+        now = time.monotonic()
+        expiry = self._unknown_tools.get(name)
+        if expiry is None or expiry <= now:
+            logger.warning("Unknown tool requested: %s", name)
+            self._unknown_tools[name] = now + UNKNOWN_TOOL_TTL
+            self._unknown_tools.move_to_end(name)
+            if len(self._unknown_tools) > UNKNOWN_TOOL_MAX_SIZE:
+                self._unknown_tools.popitem(last=False)
+        raise ValueError(f"Unknown tool: {name}")
     
     def _register_all_tools(self):
         """Register all InfoBlox tools."""
-        # Register basic DNS and DHCP tools first
-        self._register_basic_dns_tools()
-        self._register_basic_dhcp_tools()
-        self._register_basic_ipam_tools()
-        self._register_basic_grid_tools()
+        # Register basic tools first
+        for name, description, parameters, handler_name in _BASIC_TOOL_SPECS:
+            self.register_tool(name, description, parameters, getattr(self, handler_name))
+        
+        # Register extended tools from separate modules, imported here so
+        # importing this module doesn't load every tool implementation
+        from .dns_tools import DNSTools
+        from .dhcp_tools import DHCPTools
+        from .additional_tools import IPAMTools, GridTools, BulkTools, SearchTools
+        from .splunk_tools import SplunkTools
+        from .aws_import_tools import AWSImportTools
         
-        # Register extended tools from separate modules
         DNSTools.register_tools(self)
         DHCPTools.register_tools(self)
         IPAMTools.register_tools(self)
@@ -74,486 +232,346 @@ class ToolRegistry:
         SplunkTools.register_tools(self)
         AWSImportTools.register_tools(self)
     
-    def _register_basic_dns_tools(self):
-        """Register basic DNS management tools."""
-        
-        # List DNS zones
-        self.register_tool(
-            "infoblox_dns_list_zones",
-            "List all DNS zones in the InfoBlox system",
-            {
-                "type": "object",
-                "properties": {
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "zone_format": {
-                        "type": "string",
-                        "enum": ["FORWARD", "REVERSE", "IPV6"],
-                        "description": "Zone format filter (optional)"
-                    }
-                }
-            },
-            self._dns_list_zones
-        )
-        
-        # Create DNS zone
-        self.register_tool(
-            "infoblox_dns_create_zone",
-            "Create a new DNS zone",
-            {
-                "type": "object",
-                "properties": {
-                    "fqdn": {
-                        "type": "string",
-                        "description": "Fully qualified domain name for the zone"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "zone_format": {
-                        "type": "string",
-                        "enum": ["FORWARD", "REVERSE", "IPV6"],
-                        "description": "Zone format (optional, defaults to 'FORWARD')"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the zone (optional)"
-                    }
-                },
-                "required": ["fqdn"]
-            },
-            self._dns_create_zone
-        )
-        
-        # Create A record
-        self.register_tool(
-            "infoblox_dns_create_record_a",
-            "Create a DNS A record",
-            {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Record name (hostname)"
-                    },
-                    "ipv4addr": {
-                        "type": "string",
-                        "description": "IPv4 address"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "ttl": {
-                        "type": "integer",
-                        "description": "Time to live in seconds (optional)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the record (optional)"
-                    }
-                },
-                "required": ["name", "ipv4addr"]
-            },
-            self._dns_create_record_a
-        )
-        
-        # Search DNS records
-        self.register_tool(
-            "infoblox_dns_search_records",
-            "Search for DNS records",
-            {
-                "type": "object",
-                "properties": {
-                    "record_type": {
-                        "type": "string",
-                        "enum": ["A", "AAAA", "CNAME", "MX", "PTR", "SRV", "TXT"],
-                        "description": "Type of DNS record to search for"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Record name to search for (supports wildcards)"
-                    },
-                    "ip_address": {
-                        "type": "string",
-                        "description": "IP address to search for (for A/AAAA records)"
-                    },
-                    "view": {
-                        "type": "string",
-                        "description": "DNS view name (optional, defaults to 'default')"
-                    },
-                    "zone": {
-                        "type": "string",
-                        "description": "Zone to search within (optional)"
-                    }
-                },
-                "required": ["record_type"]
-            },
-            self._dns_search_records
-        )
-    
-    def _register_basic_dhcp_tools(self):
-        """Register basic DHCP management tools."""
-        
-        # List DHCP networks
-        self.register_tool(
-            "infoblox_dhcp_list_networks",
-            "List all DHCP networks",
-            {
-                "type": "object",
-                "properties": {
-                    "network_view": {
-                        "type": "string",
-                        "description": "Network view name (optional, defaults to 'default')"
-                    },
-                    "network_container": {
-                        "type": "string",
-                        "description": "Filter by network container (optional)"
-                    }
-                }
-            },
-            self._dhcp_list_networks
-        )
-        
-        # Create DHCP network
-        self.register_tool(
-            "infoblox_dhcp_create_network",
-            "Create a new DHCP network",
-            {
-                "type": "object",
-                "properties": {
-                    "network": {
-                        "type": "string",
-                        "description": "Network address in CIDR format (e.g., '192.168.1.0/24')"
-                    },
-                    "network_view": {
-                        "type": "string",
-                        "description": "Network view name (optional, defaults to 'default')"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment for the network (optional)"
-                    }
-                },
-                "required": ["network"]
-            },
-            self._dhcp_create_network
-        )
-        
-        # Get next available IP
-        self.register_tool(
-            "infoblox_dhcp_get_next_available_ip",
-            "Get the next available IP address in a network",
-            {
-                "type": "object",
-                "properties": {
-                    "network": {
-                        "type": "string",
-                        "description": "Network address in CIDR format"
-                    },
-                    "num_ips": {
-                        "type": "integer",
-                        "description": "Number of IP addresses to retrieve (default: 1)",
-                        "minimum": 1,
-                        "maximum": 100
-                    }
-                },
-                "required": ["network"]
-            },
-            self._dhcp_get_next_available_ip
-        )
-    
-    def _register_basic_ipam_tools(self):
-        """Register basic IPAM tools."""
-        
-        # Get network utilization
-        self.register_tool(
-            "infoblox_ipam_get_network_utilization",
-            "Get network utilization statistics",
-            {
-                "type": "object",
-                "properties": {
-                    "network": {
-                        "type": "string",
-                        "description": "Network address in CIDR format"
-                    }
-                },
-                "required": ["network"]
-            },
-            self._ipam_get_network_utilization
-        )
-    
-    def _register_basic_grid_tools(self):
-        """Register basic Grid management tools."""
-        
-        # List grid members
-        self.register_tool(
-            "infoblox_grid_list_members",
-            "List all grid members",
-            {
-                "type": "object",
-                "properties": {}
-            },
-            self._grid_list_members
-        )
-        
-        # Get grid status
-        self.register_tool(
-            "infoblox_grid_get_status",
-            "Get grid system status",
-            {
-                "type": "object",
-                "properties": {}
-            },
-            self._grid_get_status
-        )
-    
     # Basic tool implementation methods
     
-    async def _dns_list_zones(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
+    @tool_handler("list DNS zones")
+    async def _dns_list_zones(self, args: Dict[str, Any], client: InfoBloxClient) -> Dict[str, Any]:
         """List DNS zones."""
-        try:
-            params = {}
-            if "view" in args:
-                params["view"] = args["view"]
-            if "zone_format" in args:
-                params["zone_format"] = args["zone_format"]
-            
-            zones = client.search_objects("zone_auth", params)
-            
-            result = {
-                "zones": zones,
-                "count": len(zones)
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error listing DNS zones: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to list DNS zones: {str(e)}")
+        params = pick(args, _ZONE_FILTERS)
+        zones = await client.search_objects_async("zone_auth", params)
+        
+        return {
+            "zones": zones,
+            "count": len(zones)
+        }
     
+    @tool_handler("create DNS zone")
     async def _dns_create_zone(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Create DNS zone."""
-        try:
-            zone_data = {
-                "fqdn": args["fqdn"]
-            }
-            
-            if "view" in args:
-                zone_data["view"] = args["view"]
-            if "zone_format" in args:
-                zone_data["zone_format"] = args["zone_format"]
-            if "comment" in args:
-                zone_data["comment"] = args["comment"]
-            
-            zone_ref = client.create_object("zone_auth", zone_data)
-            
-            result = {
-                "success": True,
-                "zone_reference": zone_ref,
-                "fqdn": args["fqdn"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS zone: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS zone: {str(e)}")
+        zone_data = pick(args, _ZONE_KEYS)
+        zone_ref = await client.create_object_async("zone_auth", zone_data)
+        
+        return _ZONE_CREATED(zone_ref, args["fqdn"])
     
+    @tool_handler("create DNS A record")
     async def _dns_create_record_a(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Create DNS A record."""
-        try:
-            record_data = {
-                "name": args["name"],
-                "ipv4addr": args["ipv4addr"]
-            }
-            
-            if "view" in args:
-                record_data["view"] = args["view"]
-            if "ttl" in args:
-                record_data["ttl"] = args["ttl"]
-            if "comment" in args:
-                record_data["comment"] = args["comment"]
-            
-            record_ref = client.create_object("record:a", record_data)
-            
-            result = {
-                "success": True,
-                "record_reference": record_ref,
-                "name": args["name"],
-                "ipv4addr": args["ipv4addr"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DNS A record: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DNS A record: {str(e)}")
+        record_data = pick(args, _RECORD_A_KEYS)
+        record_ref = await client.create_object_async("record:a", record_data)
+        
+        return _RECORD_A_CREATED(record_ref, args["name"], args["ipv4addr"])
     
-    async def _dns_search_records(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
+    @tool_handler("search DNS records")
+    async def _dns_search_records(self, args: Dict[str, Any], client: InfoBloxClient) -> Dict[str, Any]:
         """Search DNS records."""
-        try:
-            record_type_map = {
-                "A": "record:a",
-                "AAAA": "record:aaaa",
-                "CNAME": "record:cname",
-                "MX": "record:mx",
-                "PTR": "record:ptr",
-                "SRV": "record:srv",
-                "TXT": "record:txt"
-            }
-            
-            object_type = record_type_map.get(args["record_type"])
-            if not object_type:
-                raise ValueError(f"Unsupported record type: {args['record_type']}")
-            
-            params = {}
-            if "name" in args:
-                params["name"] = args["name"]
-            if "ip_address" in args and args["record_type"] in ["A", "AAAA"]:
-                if args["record_type"] == "A":
-                    params["ipv4addr"] = args["ip_address"]
-                else:
-                    params["ipv6addr"] = args["ip_address"]
-            if "view" in args:
-                params["view"] = args["view"]
-            if "zone" in args:
-                params["zone"] = args["zone"]
-            
-            records = client.search_objects(object_type, params)
-            
-            result = {
-                "records": records,
-                "count": len(records),
-                "record_type": args["record_type"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error searching DNS records: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to search DNS records: {str(e)}")
+        search = _RECORD_SEARCH.get(args["record_type"])
+        if not search:
+            raise ValueError(f"Unsupported record type: {args['record_type']}")
+        
+        object_type, fields = search
+        params = {field: args[key] for key, field in fields if key in args}
+        
+        records = await client.search_objects_async(object_type, params)
+        
+        return {
+            "records": records,
+            "count": len(records),
+            "record_type": args["record_type"]
+        }
     
-    async def _dhcp_list_networks(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
+    @tool_handler("list DHCP networks")
+    async def _dhcp_list_networks(self, args: Dict[str, Any], client: InfoBloxClient) -> Dict[str, Any]:
         """List DHCP networks."""
-        try:
-            params = {}
-            if "network_view" in args:
-                params["network_view"] = args["network_view"]
-            if "network_container" in args:
-                params["network_container"] = args["network_container"]
-            
-            networks = client.search_objects("network", params)
-            
-            result = {
-                "networks": networks,
-                "count": len(networks)
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error listing DHCP networks: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to list DHCP networks: {str(e)}")
+        params = pick(args, _NETWORK_FILTERS)
+        networks = await client.search_objects_async("network", params)
+        
+        return {
+            "networks": networks,
+            "count": len(networks)
+        }
     
+    @tool_handler("create DHCP network")
     async def _dhcp_create_network(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Create DHCP network."""
-        try:
-            network_data = {
-                "network": args["network"]
-            }
-            
-            if "network_view" in args:
-                network_data["network_view"] = args["network_view"]
-            if "comment" in args:
-                network_data["comment"] = args["comment"]
-            
-            network_ref = client.create_object("network", network_data)
-            
-            result = {
-                "success": True,
-                "network_reference": network_ref,
-                "network": args["network"]
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error creating DHCP network: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to create DHCP network: {str(e)}")
+        network_data = pick(args, _NETWORK_KEYS)
+        network_ref = await client.create_object_async("network", network_data)
+        
+        return _NETWORK_CREATED(network_ref, args["network"])
     
+    @tool_handler("get next available IP")
     async def _dhcp_get_next_available_ip(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
         """Get next available IP."""
-        try:
-            num_ips = args.get("num_ips", 1)
-            ips = client.get_next_available_ip(args["network"], num_ips)
-            
-            result = {
-                "network": args["network"],
-                "available_ips": ips,
-                "count": len(ips)
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error getting next available IP: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to get next available IP: {str(e)}")
+        num_ips = args.get("num_ips", 1)
+        ips = await client.get_next_available_ip_async(args["network"], num_ips)
+        
+        return _NEXT_AVAILABLE_IPS(args["network"], ips, len(ips))
     
-    async def _ipam_get_network_utilization(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
+    @tool_handler("get network utilization")
+    async def _ipam_get_network_utilization(self, args: Dict[str, Any], client: InfoBloxClient) -> Dict[str, Any]:
         """Get network utilization."""
-        try:
-            # First find the network object
-            networks = client.search_objects("network", {"network": args["network"]})
-            if not networks:
-                raise InfoBloxAPIError(f"Network {args['network']} not found")
-            
-            network_ref = networks[0]["_ref"]
-            utilization = client.get_network_utilization(network_ref)
-            
-            result = {
-                "network": args["network"],
-                "utilization": utilization
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error getting network utilization: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to get network utilization: {str(e)}")
+        # First find the network object
+        networks = await client.search_objects_async("network", {"network": args["network"]})
+        if not networks:
+            raise InfoBloxAPIError(f"Network {args['network']} not found")
+        
+        network_ref = networks[0]["_ref"]
+        utilization = await client.get_network_utilization_async(network_ref)
+        
+        return {
+            "network": args["network"],
+            "utilization": utilization
+        }
     
-    async def _grid_list_members(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
+    @tool_handler("list grid members")
+    async def _grid_list_members(self, args: Dict[str, Any], client: InfoBloxClient) -> Dict[str, Any]:
         """List grid members."""
-        try:
-            members = client.search_objects("member")
-            
-            result = {
-                "members": members,
-                "count": len(members)
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error listing grid members: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to list grid members: {str(e)}")
+        members = await client.search_objects_async("member")
+        
+        return {
+            "members": members,
+            "count": len(members)
+        }
     
-    async def _grid_get_status(self, args: Dict[str, Any], client: InfoBloxClient) -> str:
+    @tool_handler("get grid status")
+    async def _grid_get_status(self, args: Dict[str, Any], client: InfoBloxClient) -> Dict[str, Any]:
         """Get grid status."""
-        try:
-            grid_info = client.search_objects("grid")
-            
-            result = {
-                "grid_info": grid_info,
-                "status": "operational" if grid_info else "unknown"
-            }
-            
-            return json.dumps(result, indent=2)
-            
-        except Exception as e:
-            logger.error(f"Error getting grid status: {str(e)}")
-            raise InfoBloxAPIError(f"Failed to get grid status: {str(e)}")
+        grid_info = await client.search_objects_async("grid")
+        
+        return {
+            "grid_info": grid_info,
+            "status": "operational" if grid_info else "unknown"
+        }
+
 
+# Basic tools registered by ToolRegistry itself: (name, description,
+# parameters schema, name of the handler method)
+_BASIC_TOOL_SPECS = (
+    # Basic DNS tools
+    # List DNS zones
+    (
+        "infoblox_dns_list_zones",
+        "List all DNS zones in the InfoBlox system",
+        {
+            "type": "object",
+            "properties": {
+                "view": {
+                    "type": "string",
+                    "description": "DNS view name (optional, defaults to 'default')"
+                },
+                "zone_format": {
+                    "type": "string",
+                    "enum": ["FORWARD", "REVERSE", "IPV6"],
+                    "description": "Zone format filter (optional)"
+                }
+            }
+        },
+        "_dns_list_zones"
+    ),
+    
+    # Create DNS zone
+    (
+        "infoblox_dns_create_zone",
+        "Create a new DNS zone",
+        {
+            "type": "object",
+            "properties": {
+                "fqdn": {
+                    "type": "string",
+                    "description": "Fully qualified domain name for the zone"
+                },
+                "view": {
+                    "type": "string",
+                    "description": "DNS view name (optional, defaults to 'default')"
+                },
+                "zone_format": {
+                    "type": "string",
+                    "enum": ["FORWARD", "REVERSE", "IPV6"],
+                    "description": "Zone format (optional, defaults to 'FORWARD')"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment for the zone (optional)"
+                }
+            },
+            "required": ["fqdn"]
+        },
+        "_dns_create_zone"
+    ),
+    
+    # Create A record
+    (
+        "infoblox_dns_create_record_a",
+        "Create a DNS A record",
+        {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Record name (hostname)"
+                },
+                "ipv4addr": {
+                    "type": "string",
+                    "description": "IPv4 address"
+                },
+                "view": {
+                    "type": "string",
+                    "description": "DNS view name (optional, defaults to 'default')"
+                },
+                "ttl": {
+                    "type": "integer",
+                    "description": "Time to live in seconds (optional)"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment for the record (optional)"
+                }
+            },
+            "required": ["name", "ipv4addr"]
+        },
+        "_dns_create_record_a"
+    ),
+    
+    # Search DNS records
+    (
+        "infoblox_dns_search_records",
+        "Search for DNS records",
+        {
+            "type": "object",
+            "properties": {
+                "record_type": {
+                    "type": "string",
+                    "enum": ["A", "AAAA", "CNAME", "MX", "PTR", "SRV", "TXT"],
+                    "description": "Type of DNS record to search for"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Record name to search for (supports wildcards)"
+                },
+                "ip_address": {
+                    "type": "string",
+                    "description": "IP address to search for (for A/AAAA records)"
+                },
+                "view": {
+                    "type": "string",
+                    "description": "DNS view name (optional, defaults to 'default')"
+                },
+                "zone": {
+                    "type": "string",
+                    "description": "Zone to search within (optional)"
+                }
+            },
+            "required": ["record_type"]
+        },
+        "_dns_search_records"
+    ),
+    
+    # Basic DHCP tools
+    # List DHCP networks
+    (
+        "infoblox_dhcp_list_networks",
+        "List all DHCP networks",
+        {
+            "type": "object",
+            "properties": {
+                "network_view": {
+                    "type": "string",
+                    "description": "Network view name (optional, defaults to 'default')"
+                },
+                "network_container": {
+                    "type": "string",
+                    "description": "Filter by network container (optional)"
+                }
+            }
+        },
+        "_dhcp_list_networks"
+    ),
+    
+    # Create DHCP network
+    (
+        "infoblox_dhcp_create_network",
+        "Create a new DHCP network",
+        {
+            "type": "object",
+            "properties": {
+                "network": {
+                    "type": "string",
+                    "description": "Network address in CIDR format (e.g., '192.168.1.0/24')"
+                },
+                "network_view": {
+                    "type": "string",
+                    "description": "Network view name (optional, defaults to 'default')"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment for the network (optional)"
+                }
+            },
+            "required": ["network"]
+        },
+        "_dhcp_create_network"
+    ),
+    
+    # Get next available IP
+    (
+        "infoblox_dhcp_get_next_available_ip",
+        "Get the next available IP address in a network",
+        {
+            "type": "object",
+            "properties": {
+                "network": {
+                    "type": "string",
+                    "description": "Network address in CIDR format"
+                },
+                "num_ips": {
+                    "type": "integer",
+                    "description": "Number of IP addresses to retrieve (default: 1)",
+                    "minimum": 1,
+                    "maximum": 100
+                }
+            },
+            "required": ["network"]
+        },
+        "_dhcp_get_next_available_ip"
+    ),
+    
+    # Basic IPAM tools
+    # Get network utilization
+    (
+        "infoblox_ipam_get_network_utilization",
+        "Get network utilization statistics",
+        {
+            "type": "object",
+            "properties": {
+                "network": {
+                    "type": "string",
+                    "description": "Network address in CIDR format"
+                }
+            },
+            "required": ["network"]
+        },
+        "_ipam_get_network_utilization"
+    ),
+    
+    # Basic Grid tools
+    # List grid members
+    (
+        "infoblox_grid_list_members",
+        "List all grid members",
+        {
+            "type": "object",
+            "properties": {}
+        },
+        "_grid_list_members"
+    ),
+    
+    # Get grid status
+    (
+        "infoblox_grid_get_status",
+        "Get grid system status",
+        {
+            "type": "object",
+            "properties": {}
+        },
+        "_grid_get_status"
+    )
+)
@@ -5,12 +5,68 @@ Configuration management for Open WebUI InfoBlox Integration
 import os
 import json
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Environment overrides: (variable, config field, converter for the
+# string value, or None to keep it as is)
+_ENV_MAPPINGS = (
+    ("INFOBLOX_MCP_SERVER_PATH", "mcp_server_path", None),
+    ("INFOBLOX_MCP_TIMEOUT", "mcp_server_timeout", int),
+    ("OPENAI_API_KEY", "openai_api_key", None),
+    ("ANTHROPIC_API_KEY", "anthropic_api_key", None),
+    ("GROQ_API_KEY", "groq_api_key", None),
+    ("TOGETHER_API_KEY", "together_api_key", None),
+    ("OPENAI_MODEL", "openai_model", None),
+    ("ANTHROPIC_MODEL", "anthropic_model", None),
+    ("GROQ_MODEL", "groq_model", None),
+    ("TOGETHER_MODEL", "together_model", None),
+    ("INTENT_CONFIDENCE_THRESHOLD", "intent_confidence_threshold", float),
+    ("LLM_CONFIDENCE_THRESHOLD", "llm_confidence_threshold", float),
+    ("LOG_LEVEL", "log_level", None),
+    ("LOG_FILE", "log_file", None)
+)
+
+# LLM providers and the config field holding each one's API key
+_PROVIDERS = (
+    ("openai", "openai_api_key"),
+    ("anthropic", "anthropic_api_key"),
+    ("groq", "groq_api_key"),
+    ("together", "together_api_key")
+)
+
+# Log level names accepted in log_level
+_LOG_LEVELS = {
+    name: getattr(logging, name)
+    for name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET")
+}
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON from raw file bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes for a config file."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+# Config file path -> (mtime_ns, size, parsed contents)
+_config_file_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 @dataclass
 class WebUIConfig:
@@ -62,43 +118,39 @@ class ConfigManager:
         """Load configuration from file or environment."""
         config_data = {}
         
-        # Load from file if it exists
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                logger.info(f"Loaded configuration from {self.config_file}")
-            except Exception as e:
-                logger.warning(f"Failed to load config file: {str(e)}")
+        # Load from file if it exists; unchanged files are parsed only once
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            stat = None
+        if stat is not None:
+            path = str(self.config_file.resolve())
+            entry = _config_file_cache.get(path)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                cached = entry[2]
+            else:
+                cached = None
+                try:
+                    with open(self.config_file, 'rb') as f:
+                        cached = _loads(f.read())
+                    _config_file_cache[path] = (stat.st_mtime_ns, stat.st_size, cached)
+                    logger.info(f"Loaded configuration from {self.config_file}")
+                except Exception as e:
+                    logger.warning(f"Failed to load config file: {str(e)}")
+            if cached is not None:
+                config_data = dict(cached)
         
         # Override with environment variables
-        env_mappings = {
-            "INFOBLOX_MCP_SERVER_PATH": "mcp_server_path",
-            "INFOBLOX_MCP_TIMEOUT": "mcp_server_timeout",
-            "OPENAI_API_KEY": "openai_api_key",
-            "ANTHROPIC_API_KEY": "anthropic_api_key",
-            "GROQ_API_KEY": "groq_api_key",
-            "TOGETHER_API_KEY": "together_api_key",
-            "OPENAI_MODEL": "openai_model",
-            "ANTHROPIC_MODEL": "anthropic_model",
-            "GROQ_MODEL": "groq_model",
-            "TOGETHER_MODEL": "together_model",
-            "INTENT_CONFIDENCE_THRESHOLD": "intent_confidence_threshold",
-            "LLM_CONFIDENCE_THRESHOLD": "llm_confidence_threshold",
-            "LOG_LEVEL": "log_level",
-            "LOG_FILE": "log_file"
-        }
-        
-        for env_var, config_key in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value:
-                # Convert types as needed
-                if config_key in ["mcp_server_timeout", "max_table_rows", "max_cell_length"]:
-                    config_data[config_key] = int(env_value)
-                elif config_key in ["intent_confidence_threshold", "llm_confidence_threshold"]:
-                    config_data[config_key] = float(env_value)
-                else:
-                    config_data[config_key] = env_value
+        env = os.environ
+        for env_var, config_key, convert in _ENV_MAPPINGS:
+            env_value = env.get(env_var)
+            if env_value is None:
+                continue
+            if convert is None:
+                config_data[config_key] = env_value
+            elif env_value:
+                # An empty numeric value is ignored
+                config_data[config_key] = convert(env_value)
         
         return WebUIConfig(**config_data)
     
@@ -110,8 +162,8 @@ class ConfigManager:
             config_dict = {k: v for k, v in config_dict.items() 
                           if v is not None and not k.endswith('_api_key')}
             
-            with open(self.config_file, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            with open(self.config_file, 'wb') as f:
+                f.write(_dumps(config_dict))
             
             logger.info(f"Configuration saved to {self.config_file}")
             return True
@@ -122,18 +174,8 @@ class ConfigManager:
     
     def get_available_llm_providers(self) -> List[str]:
         """Get list of available LLM providers based on API keys."""
-        providers = []
-        
-        if self.config.openai_api_key:
-            providers.append("openai")
-        if self.config.anthropic_api_key:
-            providers.append("anthropic")
-        if self.config.groq_api_key:
-            providers.append("groq")
-        if self.config.together_api_key:
-            providers.append("together")
-        
-        return providers
+        config = self.config
+        return [name for name, key_field in _PROVIDERS if getattr(config, key_field)]
     
     def validate_config(self) -> List[str]:
         """Validate configuration and return list of issues."""
@@ -158,7 +200,7 @@ class ConfigManager:
     
     def setup_logging(self):
         """Setup logging based on configuration."""
-        log_level = getattr(logging, self.config.log_level.upper(), logging.INFO)
+        log_level = _LOG_LEVELS.get(self.config.log_level.upper(), logging.INFO)
         
         # Configure logging
         logging.basicConfig(
@@ -170,17 +212,35 @@ class ConfigManager:
         logger.info(f"Logging configured: level={self.config.log_level}")
 
 
-# Global configuration instance
-config_manager = ConfigManager()
+# Global configuration instance, created on first use so importing this
+# module doesn't read the config file
+_config_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Get the global configuration manager."""
+    global _config_manager
+    if _config_manager is None:
+        _config_manager = ConfigManager()
+    return _config_manager
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from webui_integration.config import config_manager` working
+    if name == "config_manager":
+        return get_config_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_config() -> WebUIConfig:
     """Get the current configuration."""
-    return config_manager.config
+    return get_config_manager().config
 
 
 def setup_environment():
     """Setup environment for Open WebUI integration."""
+    config_manager = get_config_manager()
+    
     # Setup logging
     config_manager.setup_logging()
     
@@ -222,8 +282,8 @@ def create_example_config():
     config_file = Path("webui_config.example.json")
     
     try:
-        with open(config_file, 'w') as f:
-            json.dump(EXAMPLE_CONFIG, f, indent=2)
+        with open(config_file, 'wb') as f:
+            f.write(_dumps(EXAMPLE_CONFIG))
         
         print(f"Example configuration created: {config_file}")
         print("\nTo use this configuration:")